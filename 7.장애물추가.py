@@ -13,6 +13,12 @@ import random
 import pygame
 from pygame.sprite import Sprite
 
+from flappy.assets import asset_manager
+from flappy.collision import CollisionGroup
+from flappy.motion import Body
+from flappy.pipe_pool import PipePool
+from flappy.sprite_cache import get_sprite
+
 TITLE = "Flappy Bird"
 SCREEN_WIDTH = 288
 SCREEN_HEIGHT = 512
@@ -29,10 +35,6 @@ pygame.display.set_icon(icon)
 
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 
-def get_sprite(name):
-    directory = Path(__file__).parent / 'assets' / 'sprites'
-    return pygame.image.load(directory / f"{name}.png")
-
 
 class Bird(Sprite):
     GRAVITY = 0.4
@@ -71,14 +73,9 @@ class Bird(Sprite):
         if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
             self.fall_speed = 0 - self.FLAP_STRENGTH
 
-    def check_collision(self, sprites):
-        for sprite in sprites:
-            if isinstance(sprite, Obstacle):
-                if sprite.mask.overlap(self.mask, (self.rect.x - sprite.rect.x, self.rect.y - sprite.rect.y)):
-                    return True
-            # if self.rect.bottom < 0:
-            #     return True
-        return False
+    def check_collision(self, obstacles):
+        # 근처에 있는 장애물만 마스크로 검사한다
+        return obstacles.query(self) is not None
 
 class Background(Sprite):
     def __init__(self, index, *groups):
@@ -107,36 +104,36 @@ class Obstacle(pygame.sprite.Sprite):
     def __init__(self, *groups):
         super().__init__(*groups)
         self._layer = 3
-        self.passed = False
+        self.pool = None
         
         self._create_pipes()
+        self.reset()
+
+    def reset(self):
+        self.passed = False
         self._set_position()
         
     def _create_pipes(self):
-        pipe = get_sprite("pipe-green")
-        pipe_rect = pipe.get_rect()
-        
-        self.pipe_bottom = pipe
-        self.pipe_top = pygame.transform.flip(pipe, False, True)
-        
-        surface_height = pipe_rect.height * 2 + self.GAP
-        self.image = pygame.Surface((pipe_rect.width, surface_height), pygame.SRCALPHA)
-        self.image.blit(self.pipe_bottom, (0, pipe_rect.height + self.GAP))
-        self.image.blit(self.pipe_top, (0, 0))
-        
+        # 위/아래 파이프를 합친 이미지와 마스크는 간격마다 한 번만 만들어서 같이 쓴다
+        self.image, self.mask = asset_manager.pipe(self.GAP)
         self.rect = self.image.get_rect()
-        self.mask = pygame.mask.from_surface(self.image)
         
     def _set_position(self):
         floor_height = get_sprite("floor").get_rect().height
         min_y = 100
         max_y = SCREEN_HEIGHT - floor_height - 100
         self.rect.midleft = (SCREEN_WIDTH, random.uniform(min_y, max_y))
+        # 위치는 실수로 계산해서 SPEED 가 소수여도 정확하게 움직이게 한다
+        self.body = Body(*self.rect.topleft, vx=-self.SPEED)
         
     def update(self):
-        self.rect.x -= self.SPEED
+        self.body.step()
+        self.body.sync(self.rect)
         if self.rect.right <= 0:
-            self.kill()
+            if self.pool is not None:
+                self.pool.release(self)
+            else:
+                self.kill()
             
     def is_passed(self):
         if self.rect.x < 50 and not self.passed:
@@ -151,6 +148,12 @@ bird = Bird(sprites)
 bg1 = Background(0, sprites)
 bg2 = Background(1, sprites)
 
+# 충돌 검사는 장애물만 모아둔 그룹으로 한다
+obstacles = CollisionGroup()
+
+# 화면 밖으로 나간 장애물은 버리지 않고 다시 쓴다
+obstacle_pool = PipePool(Obstacle, capacity=8)
+
 # pygame이 자동으로 고유한 이벤트 ID를 생성해줍
 # 다른 사용자 정의 이벤트와 구분하기 위함
 PIPE_SPAWN_EVENT = pygame.event.custom_type()
@@ -167,7 +170,7 @@ while running:
             running = False
         
         if event.type == PIPE_SPAWN_EVENT:
-            obs = Obstacle(sprites)
+            obs = obstacle_pool.acquire(sprites, obstacles)
 
         bird.handle_event(event)
 
@@ -176,7 +179,8 @@ while running:
         sprites.draw(screen)
         sprites.update()
             
-        if bird.check_collision(sprites):
+        obstacles.begin_frame()
+        if bird.check_collision(obstacles):
             game_over = True
             # pygame.time.set_timer(PIPE_SPAWN_EVENT, 0)
     else:
@@ -14,6 +14,8 @@ from pathlib import Path
 import pygame
 from pygame.sprite import Sprite
 
+from flappy.sprite_cache import get_sprite
+
 TITLE = "Flappy Bird"
 SCREEN_WIDTH = 288
 SCREEN_HEIGHT = 512
@@ -30,10 +32,6 @@ pygame.display.set_icon(icon)
 
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 
-def get_sprite(name):
-    directory = Path(__file__).parent / 'assets' / 'sprites'
-    return pygame.image.load(directory / f"{name}.png")
-
 
 class Bird(Sprite):
     GRAVITY = 0.4
@@ -5,6 +5,8 @@ from pygame.sprite import Sprite, LayeredUpdates
 from pygame.surface import Surface
 from pygame.time import Clock
 
+from flappy.sprite_cache import get_sprite
+
 TITLE = "Flappy Bird"
 SCREEN_WIDTH = 288
 SCREEN_HEIGHT = 512
@@ -22,8 +24,6 @@ pygame.display.set_caption(TITLE)
 
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 
-def get_sprite(name):
-    return pygame.image.load(SPRITE_DIR / f"{name}.png")
 
 sprites = LayeredUpdates()
 clock = Clock()
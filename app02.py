@@ -1,7 +1,8 @@
 import pygame
-from pathlib import Path
 from pygame.sprite import Group, Sprite
 
+from flappy.sprite_cache import get_sprite
+
 pygame.init()
 
 pygame.display.set_caption("Flappy Bird")
@@ -9,10 +10,6 @@ pygame.display.set_caption("Flappy Bird")
 screen_size = (288, 512)
 screen = pygame.display.set_mode(screen_size)
 
-def get_sprite(name):
-    directory = Path(__file__).parent / 'assets' / 'sprites'
-    return pygame.image.load(directory / f"{name}.png")
-
 
 class Bird(Sprite):
     def __init__(self, *groups):
@@ -2,6 +2,8 @@ import pygame
 from pathlib import Path
 from pygame.sprite import Group, Sprite
 
+from flappy.sprite_cache import get_sprite
+
 TITLE = "Flappy Bird"
 SCREEN_WIDTH = 1000
 SCREEN_HEIGHT = 700
@@ -18,10 +20,6 @@ pygame.display.set_icon(icon)
 
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 
-def get_sprite(name):
-    directory = Path(__file__).parent / 'assets' / 'sprites'
-    return pygame.image.load(directory / f"{name}.png")
-
 
 class Bird(Sprite):
     GRAVITY = 0.2
@@ -6,6 +6,8 @@ from pygame.sprite import LayeredUpdates, Sprite
 from pygame.surface import Surface
 from pygame.time import Clock
 
+from flappy.sprite_cache import get_sprite
+
 TITLE = "Flappy Bird"
 SCREEN_WIDTH = 288
 SCREEN_HEIGHT = 512
@@ -21,10 +23,6 @@ pygame.init()
 pygame.display.set_caption(TITLE)
 
 
-def get_sprite(name):
-    return pygame.image.load(SPRITE_DIR / f"{name}.png")
-
-
 class Bird(Sprite):
     GRAVITY = 0.4
     FLAP_STRENGTH = 6
@@ -11,6 +11,8 @@ from pathlib import Path
 import pygame
 from pygame.sprite import Sprite
 
+from flappy.sprite_cache import get_sprite
+
 TITLE = "Flappy Bird"
 SCREEN_WIDTH = 288
 SCREEN_HEIGHT = 512
@@ -27,10 +29,6 @@ pygame.display.set_icon(icon)
 
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 
-def get_sprite(name):
-    directory = Path(__file__).parent / 'assets' / 'sprites'
-    return pygame.image.load(directory / f"{name}.png")
-
 
 class Bird(Sprite):
     GRAVITY = 0.4
@@ -44,11 +42,20 @@ class Bird(Sprite):
             get_sprite("redbird-1"),
             get_sprite("redbird-2"),
         ]
+        self.image_at_start = self.images[0]
         self.image = get_sprite("redbird-0")
         self.rect = self.image.get_rect(topleft=self.INITIAL_POSITION)
         self.fall_speed = 0
         self.mask = pygame.mask.from_surface(self.image) # NOTE
         super().__init__(*groups)
+
+    def reset(self):
+        # NOTE 다시 시작할 때 새로 만들지 않고 처음 상태로 되돌린다 (이미지를 다시 읽지 않음)
+        while self.images[0] is not self.image_at_start:
+            self.images.insert(0, self.images.pop())
+        self.image = self.images[0]
+        self.rect.topleft = self.INITIAL_POSITION
+        self.fall_speed = 0
     
     def update(self):
         self.fall_speed += self.GRAVITY
@@ -72,10 +79,14 @@ class Bird(Sprite):
 class Background(Sprite):
     def __init__(self, index, *groups):
         self._layer = 0
+        self.index = index
         self.image = get_sprite("background")
         self.rect = self.image.get_rect(topleft=(SCREEN_WIDTH*index, 0))
         super().__init__(*groups)
 
+    def reset(self):
+        self.rect.topleft = (SCREEN_WIDTH*self.index, 0)
+
     def update(self):
         self.rect.x -= 1
         if self.rect.right <= 0:
@@ -96,6 +107,10 @@ bird = Bird(sprites)
 bg1 = Background(0, sprites)
 bg2 = Background(1, sprites)
 
+# NOTE 게임 오버 메시지는 한 번만 만들어두고, 게임 오버가 될 때 그룹에 넣고 다시 시작할 때 뺀다
+# (매 프레임 GameOverMessage(sprites) 를 만들면 1초에 60개씩 그룹에 쌓인다)
+game_over_message = GameOverMessage()
+
 running = True
 game_over = False # <---- NOTE
 while running:
@@ -110,9 +125,12 @@ while running:
         screen.fill(0)  # (0,0,0) RGB = black
         sprites.draw(screen)
         sprites.update()
+
+        # 이번 프레임에 게임 오버가 됐으면 메시지를 한 번만 추가
+        if game_over:
+            sprites.add(game_over_message)
     else:
         # 게임 오버 메시지 표시
-        msg = GameOverMessage(sprites)
         sprites.draw(screen)
 
         # 게임 오버 메시지가 표시된 후 Esc 키를 누르면 게임 재시작
@@ -121,11 +139,11 @@ while running:
             # 게임 상태 초기화
             game_over = False
 
-            # 기존 스프라이트 제거 및 새로운 스프라이트 생성
-            sprites.empty()
-            Background(0, sprites)
-            Background(1, sprites)
-            bird = Bird(sprites)
+            # 스프라이트를 지우고 새로 만들지 않고 그 자리에서 처음 상태로 되돌린다
+            game_over_message.kill()
+            bg1.reset()
+            bg2.reset()
+            bird.reset()
 
     pygame.display.flip()
     clock.tick(FPS)
@@ -0,0 +1 @@
+# 게임 코드(스프라이트 로딩, 파이프 생성, update, 충돌, 그리기)의 속도를 재는 벤치마크 모음
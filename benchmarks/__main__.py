@@ -0,0 +1,65 @@
+# 벤치마크 실행 (창 없이 SDL dummy 드라이버로 실행한다)
+#
+#   python -m benchmarks                    # 결과를 benchmarks/results/latest.json 에 저장
+#   python -m benchmarks --save-baseline    # 지금 결과를 기준으로 저장
+#   python -m benchmarks --check            # 기준보다 25% 이상 느려진 항목이 있으면 실패 (exit 1)
+#   python -m benchmarks --filter collision --quick
+
+import argparse
+import sys
+from pathlib import Path
+
+import pygame
+
+from flappy.headless import use_dummy_drivers
+from flappy.settings import SCREEN_HEIGHT, SCREEN_WIDTH
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게임 코드 벤치마크")
+    parser.add_argument("--filter", help="이름에 이 문자열이 들어간 벤치마크만 실행")
+    parser.add_argument("--quick", action="store_true", help="반복 횟수를 줄여서 빠르게 실행")
+    parser.add_argument("--output", type=Path, default=RESULTS_DIR / "latest.json")
+    parser.add_argument("--baseline", type=Path, default=RESULTS_DIR / "baseline.json")
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 기준 파일로도 저장")
+    parser.add_argument("--threshold", type=float, default=1.25, help="이 배율 이상 느려지면 회귀로 본다")
+    parser.add_argument("--check", action="store_true", help="회귀가 있으면 exit 1")
+    args = parser.parse_args()
+
+    use_dummy_drivers()
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    # 화면을 만든 뒤에 불러와야 스프라이트가 화면 포맷으로 변환된다
+    from benchmarks import bench_blit, bench_ecs, bench_game  # noqa: F401
+    from benchmarks.harness import compare, load, run, save
+
+    results = run(args.filter, args.quick)
+    save(args.output, results)
+    print(f"saved {args.output}")
+
+    if args.save_baseline:
+        save(args.baseline, results)
+        print(f"saved baseline {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print("no baseline (run with --save-baseline first)")
+        return 0
+
+    rows, regressions = compare(results, load(args.baseline), args.threshold)
+    print(f"\n{'benchmark':<28} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for key, before, current, ratio in rows:
+        mark = "  <-- slower" if ratio > args.threshold else ""
+        print(f"{key:<28} {before:>10.2f}us {current:>10.2f}us {ratio:>6.2f}x{mark}")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.2f}x")
+        return 1 if args.check else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+# 화면 포맷으로 변환하기 전/후의 blit 속도 비교
+#
+#   blit.<이름>.raw            PNG 를 읽은 그대로 (blit 할 때마다 픽셀 포맷 변환)
+#   blit.<이름>.convert_alpha  convert_alpha() 한 이미지
+#   blit.<이름>.display        display_format() 한 이미지 (불투명하면 convert(), 아니면 convert_alpha())
+
+import pygame
+
+from benchmarks.harness import benchmark
+from flappy.assets import asset_manager
+from flappy.settings import SCREEN_HEIGHT, SCREEN_WIDTH, SPRITES_DIR
+from flappy.sprite_cache import display_format
+
+BLITS = 20  # 한 번 호출에 blit 하는 횟수
+
+
+def _raw(name):
+    return pygame.image.load(SPRITES_DIR / f"{name}.png")
+
+
+def _pipe_raw():
+    # make_pipe_prefab 과 같은 방식으로 합쳤지만 변환하지 않은 이미지
+    sprite = _raw("pipe-green")
+    width, height = sprite.get_size()
+    image = pygame.Surface((width, height * 2 + 100), pygame.SRCALPHA)
+    image.blit(sprite, (0, height + 100))
+    image.blit(pygame.transform.flip(sprite, False, True), (0, 0))
+    return image
+
+
+SOURCES = {
+    "background": lambda: _raw("background"),
+    "redbird": lambda: _raw("redbird-0"),
+    "pipe": _pipe_raw,
+}
+FORMATS = {
+    "raw": lambda surface: surface,
+    "convert_alpha": lambda surface: surface.convert_alpha(),
+    "display": display_format,
+}
+
+
+def _register(source, format_name):
+    @benchmark(f"blit.{source}.{format_name}", number=50)
+    def bench():
+        image = FORMATS[format_name](SOURCES[source]())
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+
+        def blit():
+            for _ in range(BLITS):
+                screen.blit(image, (0, 0))
+
+        return blit
+
+
+for _source in SOURCES:
+    for _format in FORMATS:
+        _register(_source, _format)
+
+
+@benchmark("blit.pipe.prefab", number=50)
+def bench_pipe_prefab():
+    # 게임에서 실제로 쓰는 파이프 이미지
+    image, _ = asset_manager.pipe(100)
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+
+    def blit():
+        for _ in range(BLITS):
+            screen.blit(image, (0, 0))
+
+    return blit
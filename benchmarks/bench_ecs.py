@@ -0,0 +1,74 @@
+# flappy.ecs 의 배열 기반 시스템과 스프라이트 객체 방식(bench_game 의 sprites.update / sprites.draw) 비교
+#
+#   ecs.update/N        move + wrap_around (새, 하늘, 바닥, 파이프 N개)
+#   ecs.draw/N          World.draw (surface.blits 한 번)
+#   ecs.views/N         sync_views + LayeredUpdates.draw (기존 그룹으로 그리는 경우)
+
+import random
+
+import pygame
+from pygame.sprite import LayeredUpdates
+
+from benchmarks.bench_game import UPDATE_FRAMES
+from benchmarks.harness import SIZES, benchmark
+from flappy.assets import asset_manager
+from flappy.ecs import World
+from flappy.settings import SCREEN_HEIGHT, SCREEN_WIDTH
+from flappy.sim import DEFAULT_RULES as RULES
+from flappy.sprite_cache import get_sprite
+from flappy.sprites import Layer
+
+
+def make_world(n, seed=0):
+    rng = random.Random(seed)
+    world = World()
+    bird = get_sprite("redbird-0")
+    world.spawn(bird, RULES.bird_x, SCREEN_HEIGHT / 2 - 50, ay=RULES.gravity, layer=Layer.PLAYER)
+
+    sky = get_sprite("background")
+    world.spawn(sky, vx=-RULES.background_speed, wrap=sky.get_width(), layer=Layer.BACKGROUND)
+    floor = get_sprite("floor")
+    floor_y = SCREEN_HEIGHT - floor.get_height()
+    world.spawn(floor, y=floor_y, vx=-RULES.pipe_speed, wrap=floor.get_width(), layer=Layer.FLOOR)
+
+    image, _ = asset_manager.pipe(RULES.gap)
+    left = RULES.pipe_speed * UPDATE_FRAMES
+    for i in range(n):
+        y = rng.uniform(RULES.pipe_margin, 300) - image.get_height() / 2
+        x = left + (SCREEN_WIDTH - left) * i / n
+        world.spawn(image, x, y, vx=-RULES.pipe_speed, layer=Layer.OBSTACLE, cull=True)
+    return world
+
+
+@benchmark("ecs.update", sizes=SIZES, number=UPDATE_FRAMES)
+def bench_update(n):
+    world = make_world(n)
+
+    def update():
+        world.move()
+        world.wrap_around()
+        world.cull()
+
+    return update
+
+
+@benchmark("ecs.draw", sizes=SIZES, number=20)
+def bench_draw(n):
+    world = make_world(n)
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    return lambda: world.draw(surface)
+
+
+@benchmark("ecs.views", sizes=SIZES, number=20)
+def bench_views(n):
+    world = make_world(n)
+    group = LayeredUpdates()
+    for entity in world.entities().tolist():
+        world.view(entity, group)
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+
+    def draw():
+        world.sync_views()
+        group.draw(surface)
+
+    return draw
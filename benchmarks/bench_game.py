@@ -0,0 +1,159 @@
+# 게임 한 프레임에 하는 일들을 파이프 수(1, 10, 100, 1000)를 바꿔가며 잰다
+#
+#   sprite.load_cold     디스크에서 PNG 를 읽고 화면 포맷으로 변환 (캐시 없음)
+#   sprite.load_cached   get_sprite 캐시 적중
+#   pipe.construct/N     Pipe N개 새로 만들기
+#   pipe.pool/N          PipePool 에서 N개 꺼내고 돌려놓기
+#   sprites.update/N     LayeredUpdates.update (새, 배경, 파이프 N개)
+#   collision/N          Bird.check_collision (CollisionGroup 으로 근처 파이프만 검사)
+#   collision.lane/N     Bird.check_collision (PipeLane 으로 왼쪽부터 새 근처까지만 검사)
+#   collision.naive/N    모든 파이프를 마스크로 검사 (비교용)
+#   score.lane/N         PipeLane 으로 새가 지나간 파이프 찾기
+#   score.scan/N         그룹 전체를 돌면서 파이프를 찾아 지나갔는지 확인 (비교용)
+#   sprites.draw/N       화면 밖 Surface 에 모든 스프라이트 그리기
+
+import random
+
+import pygame
+from pygame.sprite import LayeredUpdates
+
+from benchmarks.harness import SIZES, benchmark
+from flappy.collision import CollisionGroup
+from flappy.lane import PipeLane
+from flappy.loop import REFERENCE_RATE
+from flappy.pipe_pool import PipePool
+from flappy.settings import SCREEN_HEIGHT, SCREEN_WIDTH
+from flappy.sim import DEFAULT_RULES as RULES
+from flappy.sprite_cache import SpriteCache, get_sprite, sprite_cache
+from flappy.sprites import Bird, Layer, Pipe, ScrollLayer
+
+DT = 1 / REFERENCE_RATE
+UPDATE_FRAMES = 20  # 이만큼 update 해도 가장 왼쪽 파이프가 화면 밖으로 나가지 않는다
+
+
+def make_world(n, seed=0, lane=False):
+    # 새 한 마리, 하늘과 바닥, 화면에 고르게 퍼진 파이프 n개
+    rng = random.Random(seed)
+    sprites = LayeredUpdates()
+    obstacles = PipeLane() if lane else CollisionGroup()
+
+    bird = Bird(sprites)
+    bird.body.x, bird.body.y = RULES.bird_x, SCREEN_HEIGHT / 2 - 50
+    bird.body.sync(bird.rect)
+    ScrollLayer(get_sprite("background"), RULES.background_speed, 0, Layer.BACKGROUND, sprites)
+    floor = get_sprite("floor")
+    ScrollLayer(floor, RULES.pipe_speed, SCREEN_HEIGHT - floor.get_height(), Layer.FLOOR, sprites)
+
+    left = RULES.pipe_speed * UPDATE_FRAMES
+    for i in range(n):
+        pipe = Pipe(sprites, obstacles, rng=rng)
+        pipe.body.x = left + (SCREEN_WIDTH - left) * i / n
+        pipe.body.sync(pipe.rect)
+    return sprites, obstacles, bird
+
+
+@benchmark("sprite.load_cold", number=20)
+def bench_load_cold():
+    return lambda: SpriteCache().get("pipe-green")
+
+
+@benchmark("sprite.load_cached", number=10_000)
+def bench_load_cached():
+    sprite_cache.get("pipe-green")
+    return lambda: sprite_cache.get("pipe-green")
+
+
+@benchmark("pipe.construct", sizes=SIZES, number=5)
+def bench_pipe_construct(n):
+    rng = random.Random(0)
+
+    def construct():
+        group = LayeredUpdates()
+        for _ in range(n):
+            Pipe(group, rng=rng)
+
+    return construct
+
+
+@benchmark("pipe.pool", sizes=SIZES, number=5)
+def bench_pipe_pool(n):
+    rng = random.Random(0)
+    pool = PipePool(lambda *groups: Pipe(*groups, rng=rng), capacity=n)
+    group = LayeredUpdates()
+
+    def cycle():
+        pipes = [pool.acquire(group) for _ in range(n)]
+        for pipe in pipes:
+            pool.release(pipe)
+
+    cycle()  # 풀을 미리 채워둔다
+    return cycle
+
+
+@benchmark("sprites.update", sizes=SIZES, number=UPDATE_FRAMES)
+def bench_update(n):
+    sprites, _, _ = make_world(n)
+    return lambda: sprites.update(DT)
+
+
+@benchmark("collision", sizes=SIZES, number=200)
+def bench_collision(n):
+    _, obstacles, bird = make_world(n)
+
+    def check():
+        obstacles.begin_frame()
+        bird.check_collision(obstacles)
+
+    return check
+
+
+@benchmark("collision.lane", sizes=SIZES, number=200)
+def bench_collision_lane(n):
+    _, obstacles, bird = make_world(n, lane=True)
+
+    def check():
+        obstacles.begin_frame()
+        bird.check_collision(obstacles)
+
+    return check
+
+
+@benchmark("score.lane", sizes=SIZES, number=200)
+def bench_score_lane(n):
+    _, obstacles, _ = make_world(n, lane=True)
+
+    def collect():
+        # 매번 같은 조건으로 재도록 지나간 표시를 되돌린다
+        for pipe in list(obstacles.lane)[: obstacles.passed]:
+            pipe.passed = False
+        obstacles.passed = 0
+        return obstacles.collect_passed(RULES.bird_x)
+
+    return collect
+
+
+@benchmark("score.scan", sizes=SIZES, number=200)
+def bench_score_scan(n):
+    sprites, _, _ = make_world(n)
+
+    def scan():
+        count = 0
+        for sprite in sprites:
+            if type(sprite) is Pipe and sprite.body.x < RULES.bird_x and not sprite.passed:
+                count += 1
+        return count
+
+    return scan
+
+
+@benchmark("collision.naive", sizes=SIZES, number=20)
+def bench_collision_naive(n):
+    _, obstacles, bird = make_world(n)
+    return lambda: pygame.sprite.spritecollide(bird, obstacles, False, pygame.sprite.collide_mask)
+
+
+@benchmark("sprites.draw", sizes=SIZES, number=20)
+def bench_draw(n):
+    sprites, _, _ = make_world(n)
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    return lambda: sprites.draw(surface)
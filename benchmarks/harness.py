@@ -0,0 +1,99 @@
+# 벤치마크를 등록하고 시간을 재서 JSON 으로 저장하고, 저장해둔 기준(baseline)과 비교하는 도구
+#
+#   @benchmark("update", sizes=SIZES, number=30)
+#   def bench_update(n):
+#       world = make_world(n)           # 준비 작업은 시간에 넣지 않는다
+#       return lambda: world.update()   # 이 함수를 number 번 호출하는 시간을 잰다
+#
+# 준비 함수는 반복(repeat)마다 새로 호출하므로, 재는 동안 상태가 바뀌어도 매번 같은 조건에서 시작한다.
+
+import json
+import platform
+import statistics
+import time
+from time import perf_counter
+
+import pygame
+
+SIZES = (1, 10, 100, 1000)  # 동시에 화면에 있는 파이프 수
+
+_benchmarks = []
+
+
+def benchmark(name, sizes=(None,), number=100, repeat=5):
+    def decorator(make):
+        _benchmarks.append((name, tuple(sizes), number, repeat, make))
+        return make
+
+    return decorator
+
+
+def result_key(name, n):
+    return name if n is None else f"{name}/{n}"
+
+
+def measure(make, n, number, repeat):
+    # 반복마다 number 번 호출해서 한 번 호출에 걸린 시간(초)을 구한다
+    times = []
+    for _ in range(repeat):
+        fn = make(n) if n is not None else make()
+        fn()  # 첫 호출(캐시, 메모리 할당)은 빼고 잰다
+        start = perf_counter()
+        for _ in range(number):
+            fn()
+        times.append((perf_counter() - start) / number)
+    return {
+        "n": n,
+        "number": number,
+        "repeat": repeat,
+        "min_us": min(times) * 1e6,
+        "median_us": statistics.median(times) * 1e6,
+    }
+
+
+def run(pattern=None, quick=False, report=print):
+    results = {}
+    for name, sizes, number, repeat, make in _benchmarks:
+        if pattern and pattern not in name:
+            continue
+        if quick:
+            number, repeat = max(1, number // 10), 2
+        for n in sizes:
+            key = result_key(name, n)
+            results[key] = measure(make, n, number, repeat)
+            report(f"{key:<28} {results[key]['min_us']:>12.2f} us")
+    return results
+
+
+def metadata():
+    return {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "sdl": ".".join(map(str, pygame.get_sdl_version())),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "video_driver": pygame.display.get_driver() if pygame.display.get_init() else None,
+    }
+
+
+def save(path, results):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"meta": metadata(), "results": results}, indent=2))
+
+
+def load(path):
+    return json.loads(path.read_text())["results"]
+
+
+def compare(results, baseline, threshold=1.25):
+    # 기준보다 threshold 배 이상 느려진 항목을 돌려준다. (이름, 기준 us, 현재 us, 배율)
+    rows = []
+    for key, current in results.items():
+        if key not in baseline:
+            continue
+        before = baseline[key]["min_us"]
+        ratio = current["min_us"] / before if before else float("inf")
+        rows.append((key, before, current["min_us"], ratio))
+    regressions = [row for row in rows if row[3] > threshold]
+    return rows, regressions
@@ -0,0 +1 @@
+# Flappy Bird 게임에서 공통으로 사용하는 모듈 모음
@@ -0,0 +1,52 @@
+# 여러 장의 이미지를 번갈아 보여주는 애니메이션 (새의 날갯짓)
+#
+# 프레임 이미지와 마스크는 스프라이트 묶음(sheet)마다 한 번만 만들어 FrameTable 에 넣고 모든 새가 같이 쓴다.
+# 새마다 갖는 것은 지금 몇 번째 프레임인지 가리키는 커서(FlapCursor) 뿐이다.
+# 옛날 수업 코드처럼 images.insert(0, images.pop()) 으로 리스트를 매 프레임 돌리지 않는다.
+#
+#   table = assets.frames("redbird")       # redbird-0, 1, 2, 1 (이미지, 마스크). flappy.assets 에서 한 번만 만든다
+#   cursor = FlapCursor(len(table))        # flappy.flap
+#   index = cursor.advance(k, flapping)    # k: 60Hz 기준 진행한 프레임 수 (flappy.loop.steps)
+#   sprite.image, sprite.mask = table.frame(index)
+
+from dataclasses import dataclass
+
+import pygame
+from pygame.mask import Mask
+from pygame.surface import Surface
+
+# 묶음 이름 -> 보여줄 순서 (파일 이름 "{묶음}-{번호}.png" 의 번호)
+SEQUENCES = {
+    "redbird": (0, 1, 2, 1),  # 날개 접힘 -> 중간 -> 펴짐 -> 중간
+}
+
+
+@dataclass(frozen=True)
+class FrameTable:
+    # 모든 스프라이트가 같이 쓰므로 이 이미지에 그림을 그리면 안 된다
+    name: str
+    frames: tuple[Surface, ...]
+    masks: tuple[Mask, ...]  # frames 와 같은 순서. 같은 이미지는 같은 마스크 객체
+
+    def __len__(self):
+        return len(self.frames)
+
+    def frame(self, index) -> tuple[Surface, Mask]:
+        return self.frames[index], self.masks[index]
+
+
+def frame_names(name) -> tuple[str, ...]:
+    # 묶음 name 의 프레임 이미지 이름 (보여줄 순서대로, 같은 이름이 여러 번 나올 수 있음)
+    return tuple(f"{name}-{number}" for number in SEQUENCES[name])
+
+
+def make_frame_table(sprites, name) -> FrameTable:
+    # sprites(flappy.sprite_cache.SpriteCache)의 이미지로 묶음 name 의 프레임 표를 만든다.
+    # 같이 쓸 표는 AssetManager.frames 로 가져온다 (여기서 매번 새로 만들지 않도록)
+    masks = {}
+    frames = []
+    for sprite_name in frame_names(name):
+        frames.append(sprites.get(sprite_name))
+        if sprite_name not in masks:
+            masks[sprite_name] = pygame.mask.from_surface(frames[-1])
+    return FrameTable(name, tuple(frames), tuple(masks[sprite_name] for sprite_name in frame_names(name)))
@@ -0,0 +1,171 @@
+# 게임에서 쓰는 모든 리소스(스프라이트, 효과음, 아이콘, 미리 만들어두는 이미지/마스크)를 한 곳에서 관리한다
+#
+#   assets = asset_manager       # 게임 전체에서 같이 쓰는 관리자 (Bird, Pipe 도 여기서 가져온다)
+#   screen = open_window(size, icon=assets.icon())
+#   assets.warmup()              # 첫 프레임 전에 전부 읽어두기 (하지 않으면 처음 쓸 때 읽는다)
+#   assets.sprite("redbird-0")
+#   assets.mask("redbird-0")
+#   assets.frames("redbird")     # 날갯짓 프레임 표 (모든 새가 같이 쓰는 이미지와 마스크)
+#   assets.pipe(gap)             # 위/아래 파이프를 합친 이미지와 마스크 (모든 파이프가 같이 씀)
+#   assets.play_audio("point")
+#   assets.memory()              # 리소스별 메모리 사용량 (바이트)
+#
+# 스프라이트는 flappy.sprite_cache 의 캐시를 같이 쓰므로 get_sprite() 로 읽은 것과 같은 Surface 이다.
+# 프레임 표, 파이프 이미지처럼 스프라이트로 만드는 것은 관리자마다 자기 sprites 로 만들어 갖고 있는다.
+
+import pygame
+from pygame.mask import Mask
+from pygame.surface import Surface
+
+from flappy.animation import SEQUENCES, FrameTable, frame_names, make_frame_table
+from flappy.atlas import load_atlas_sprites
+from flappy.audio import AudioManager
+from flappy.pipe_pool import PIPE_SPRITE, make_pipe_prefab
+from flappy.settings import AUDIOS_DIR, ICON_DIR
+from flappy.sim import DEFAULT_RULES
+from flappy.sprite_cache import SpriteCache, sprite_cache
+
+
+def surface_bytes(surface: Surface):
+    # 픽셀 데이터 크기 (한 줄의 바이트 수 x 높이)
+    return surface.get_pitch() * surface.get_height()
+
+
+def mask_bytes(mask: Mask):
+    # 마스크는 픽셀마다 1비트
+    width, height = mask.get_size()
+    return (width * height + 7) // 8
+
+
+def sound_bytes(sound: pygame.mixer.Sound):
+    frequency, size, channels = pygame.mixer.get_init()
+    return round(sound.get_length() * frequency) * abs(size) // 8 * channels
+
+
+class AssetManager:
+    def __init__(
+        self, sprites: SpriteCache = sprite_cache, audio_dir=AUDIOS_DIR, icon_path=ICON_DIR / "red_bird.png"
+    ):
+        self.sprites = sprites
+        self.audio_dir = audio_dir
+        self.icon_path = icon_path
+
+        self._audio = None
+        self._icon = None
+        # 스프라이트에서 만들어내는 것들 (뒤집은 이미지, 마스크, 프레임 표, 파이프 이미지). 키는 (종류, 이름, ...) 튜플
+        # 값은 (만든 것, 만들 때 쓴 스프라이트들의 version)
+        self._derived: dict[tuple, tuple[object, tuple[int, ...]]] = {}
+
+    # 스프라이트
+
+    def sprite(self, name) -> Surface:
+        return self.sprites.get(name)
+
+    def icon(self) -> Surface:
+        # 창 아이콘은 set_mode 전에 설정하므로 변환하지 않는다
+        if self._icon is None:
+            self._icon = pygame.image.load(self.icon_path)
+        return self._icon
+
+    def derived(self, key, factory, sources):
+        # 스프라이트 sources 로 한 번만 만들어서 같이 쓰는 이미지/마스크. 돌려받은 Surface 에 그림을 그리면 안 된다.
+        # sources 중 하나가 바뀌었을 때만(set_mode 뒤 화면 포맷으로 변환 등) 처음 쓸 때 바뀐 스프라이트로 다시 만든다.
+        entry = self._derived.get(key)
+        if entry is None or entry[1] != self._versions(sources):
+            value = factory()
+            entry = self._derived[key] = (value, self._versions(sources))
+        return entry[0]
+
+    def flipped(self, name, flip_x=False, flip_y=True) -> Surface:
+        return self.derived(
+            ("flipped", name, flip_x, flip_y),
+            lambda: pygame.transform.flip(self.sprite(name), flip_x, flip_y),
+            (name,),
+        )
+
+    def mask(self, name) -> Mask:
+        return self.derived(("mask", name), lambda: pygame.mask.from_surface(self.sprite(name)), (name,))
+
+    def frames(self, name) -> FrameTable:
+        # 애니메이션 프레임 이미지와 마스크 (묶음마다 한 번만 만든다)
+        return self.derived(("frames", name), lambda: make_frame_table(self.sprites, name), frame_names(name))
+
+    def pipe(self, gap=DEFAULT_RULES.gap) -> tuple[Surface, Mask]:
+        # 위/아래 파이프를 합친 이미지와 마스크 (간격마다 한 번만 만든다)
+        return self.derived(("pipe", gap), lambda: make_pipe_prefab(self.sprites, gap), (PIPE_SPRITE,))
+
+    def _versions(self, sources):
+        return tuple(self.sprites.version(name) for name in sources)
+
+    # 효과음
+
+    @property
+    def audio(self) -> AudioManager:
+        return self.load_audio()
+
+    def load_audio(self) -> AudioManager:
+        # 처음 부를 때 모든 WAV 를 디코딩한다 (게임 중에 멈추지 않도록 warmup 에서 미리 부른다)
+        if self._audio is None:
+            self._audio = AudioManager(self.audio_dir)
+        return self._audio
+
+    def play_audio(self, name):
+        return self.audio.play(name)
+
+    # 미리 읽기 / 메모리
+
+    def warmup(self, gaps=(DEFAULT_RULES.gap,)):
+        # set_mode 이후, 첫 프레임 전에 호출한다. 게임 중에 디스크를 읽거나 디코딩하지 않도록 전부 준비해둔다.
+        if self.sprites is sprite_cache:
+            load_atlas_sprites()
+        else:
+            self.sprites.preload()
+        self.sprites.convert_all()
+
+        for name in SEQUENCES:
+            self.frames(name)
+        for gap in gaps:
+            self.pipe(gap)
+        self.icon()
+        self.load_audio()
+        return self.memory_total()
+
+    def memory(self):
+        # 리소스별 메모리 사용량 (바이트). 같은 Surface 를 여러 이름으로 쓰면 처음 것에만 센다.
+        seen = set()
+        usage = {}
+
+        def add(name, value, size):
+            if id(value) not in seen:
+                seen.add(id(value))
+                usage[name] = size
+
+        for name, surface in self.sprites.surfaces().items():
+            add(f"sprite:{name}", surface, surface_bytes(surface))
+        if self._icon is not None:
+            add("icon", self._icon, surface_bytes(self._icon))
+        for key, (value, _) in self._derived.items():
+            name = ":".join(str(part) for part in key)
+            if isinstance(value, FrameTable):
+                # 프레임 이미지는 스프라이트 그대로이므로 마스크만 센다
+                for index, mask in enumerate(value.masks):
+                    add(f"{name}:mask:{index}", mask, mask_bytes(mask))
+            elif isinstance(value, tuple):
+                image, mask = value
+                add(name, image, surface_bytes(image))
+                add(f"{name}:mask", mask, mask_bytes(mask))
+            elif isinstance(value, Mask):
+                add(name, value, mask_bytes(value))
+            else:
+                add(name, value, surface_bytes(value))
+        if self._audio is not None:
+            for name, sound in self._audio.sounds.items():
+                add(f"audio:{name}", sound, sound_bytes(sound))
+        return usage
+
+    def memory_total(self):
+        return sum(self.memory().values())
+
+
+# 게임 전체에서 하나만 사용하는 관리자
+asset_manager = AssetManager()
@@ -0,0 +1,161 @@
+# 텍스처 아틀라스
+# assets/sprites 의 PNG 들을 하나의 큰 이미지로 합쳐서 파일 하나에 저장해두고,
+# 게임을 시작할 때는 그 파일 하나만 mmap 으로 열어서 잘라 쓴다.
+#
+# 파일 구조 (assets/sprites.atlas)
+#   헤더     : MAGIC, VERSION, 아틀라스 너비, 높이, 인덱스(JSON) 길이
+#   인덱스   : {"sprites": {이름: [x, y, w, h]}, "sources": {이름: [파일 크기, 수정 시각]}}
+#   픽셀     : RGBA 순서의 원본 픽셀 (너비 * 높이 * 4 바이트)
+#
+# 아틀라스 만들기:  python -m flappy.atlas
+
+import argparse
+import json
+import mmap
+import struct
+
+import pygame
+
+from flappy.settings import ASSETS_DIR, SPRITES_DIR
+from flappy.sprite_cache import load_sprites, sprite_cache
+
+ATLAS_PATH = ASSETS_DIR / "sprites.atlas"
+
+MAGIC = b"FBAT"
+VERSION = 1
+HEADER = struct.Struct("<4sHHHI")  # magic, version, width, height, index 길이
+
+ATLAS_WIDTH = 1024
+PADDING = 1  # 이웃한 이미지의 픽셀이 번지지 않도록 띄우는 간격
+
+
+def _source_info(directory):
+    return {
+        file.stem: [file.stat().st_size, file.stat().st_mtime_ns]
+        for file in sorted(directory.glob("*.png"))
+    }
+
+
+def _pack(sizes, width):
+    # 높이가 큰 것부터 한 줄(shelf)씩 왼쪽에서 오른쪽으로 채운다
+    rects = {}
+    x = y = shelf_height = 0
+    for name, (w, h) in sorted(sizes.items(), key=lambda item: (-item[1][1], item[0])):
+        if w > width:
+            raise ValueError(f"{name} 이미지가 아틀라스보다 넓습니다 ({w} > {width})")
+        if x + w > width:
+            x = 0
+            y += shelf_height + PADDING
+            shelf_height = 0
+        rects[name] = [x, y, w, h]
+        x += w + PADDING
+        shelf_height = max(shelf_height, h)
+    return rects, y + shelf_height
+
+
+def build_atlas(directory=SPRITES_DIR, path=ATLAS_PATH, width=ATLAS_WIDTH):
+    images = {}
+    for file in sorted(directory.glob("*.png")):
+        # 팔레트/컬러키 이미지도 있으므로 모두 RGBA 픽셀로 맞춘다
+        image = pygame.image.load(file)
+        images[file.stem] = pygame.image.frombytes(
+            pygame.image.tobytes(image, "RGBA"), image.get_size(), "RGBA"
+        )
+    rects, height = _pack({name: image.get_size() for name, image in images.items()}, width)
+
+    atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+    for name, image in images.items():
+        # 알파를 섞지 않고 픽셀을 그대로 복사한다 (빈 아틀라스는 0 이므로 MAX = 복사)
+        atlas.blit(image, rects[name][:2], special_flags=pygame.BLEND_RGBA_MAX)
+
+    index = json.dumps(
+        {"sprites": rects, "sources": _source_info(directory)}, sort_keys=True
+    ).encode()
+
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, width, height, len(index)))
+        file.write(index)
+        file.write(pygame.image.tobytes(atlas, "RGBA"))
+    return rects
+
+
+class Atlas:
+    # mmap 으로 연 아틀라스 파일. Surface 들이 파일 내용을 그대로 참조하므로
+    # 사용하는 동안에는 close() 하면 안 된다.
+
+    def __init__(self, path=ATLAS_PATH):
+        self._file = open(path, "rb")
+        self._map = None
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._read(path)
+        except BaseException:
+            # 잘리거나 깨진 파일이면 열어둔 파일과 mmap 을 닫고 그대로 알린다
+            self.close()
+            raise
+
+    def _read(self, path):
+        magic, version, width, height, index_size = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} 는 지원하지 않는 아틀라스 파일입니다")
+
+        start = HEADER.size
+        index = json.loads(self._map[start : start + index_size])
+        self.rects = index["sprites"]
+        self.sources = index["sources"]
+
+        # 픽셀 크기를 먼저 확인한다 (frombuffer 가 실패해도 만든 memoryview 가 남아서 mmap 을 닫을 수 없음)
+        if len(self._map) - start - index_size != width * height * 4:
+            raise ValueError(f"{path} 의 픽셀 데이터가 잘렸습니다")
+        pixels = memoryview(self._map)[start + index_size :]
+        self.surface = pygame.image.frombuffer(pixels, (width, height), "RGBA")
+
+    def is_stale(self, directory=SPRITES_DIR):
+        return self.sources != _source_info(directory)
+
+    def subsurface(self, name):
+        return self.surface.subsurface(self.rects[name])
+
+    def sprites(self):
+        return {name: self.subsurface(name) for name in self.rects}
+
+    def close(self):
+        # frombuffer 로 만든 Surface 가 남아있으면 mmap 을 닫을 수 없다
+        self.__dict__.pop("surface", None)
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+
+# 게임에서 사용중인 아틀라스 (mmap 이 닫히지 않도록 참조를 유지)
+atlas = None
+
+
+def load_atlas_sprites(path=ATLAS_PATH, directory=SPRITES_DIR):
+    # 아틀라스가 없거나 PNG 보다 오래됐으면 기존처럼 PNG 를 하나씩 읽는다
+    global atlas
+    try:
+        loaded = Atlas(path)
+    except (OSError, ValueError, KeyError, struct.error):
+        # 없거나, 헤더보다 짧거나, 인덱스/픽셀이 잘린 파일
+        return load_sprites()
+
+    if loaded.is_stale(directory):
+        loaded.close()
+        return load_sprites()
+
+    atlas = loaded
+    for name, surface in loaded.sprites().items():
+        sprite_cache.put(name, surface)
+    sprite_cache.convert_all()
+    return sprite_cache.surfaces()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="assets/sprites 를 하나의 아틀라스 파일로 합칩니다")
+    parser.add_argument("--output", default=ATLAS_PATH)
+    parser.add_argument("--width", type=int, default=ATLAS_WIDTH)
+    args = parser.parse_args()
+
+    rects = build_atlas(path=args.output, width=args.width)
+    print(f"{len(rects)}개의 스프라이트를 {args.output} 에 저장했습니다")
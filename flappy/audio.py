@@ -0,0 +1,105 @@
+# 효과음 관리 (assets/audios/*.wav)
+#
+#   pre_init()                 # pygame.init() 전에 호출하면 소리가 늦게 나는 것(지연)을 줄인다
+#   audio = AudioManager()     # set_mode 이후, 게임 시작 전에 모든 WAV 를 미리 Sound 로 디코딩
+#   audio.play("point")
+#
+# Sound.play 는 소리를 섞는 스레드에 맡기고 바로 돌아오므로 게임 루프를 멈추지 않는다.
+# 채널은 정해진 개수만 쓰고, 모두 재생 중이면 가장 먼저 시작한 소리를 끊고 그 채널에서 재생한다.
+# 오디오 장치가 없거나 dummy 드라이버(화면 없는 실행)면 아무 소리도 내지 않는다.
+
+import os
+
+import pygame
+
+from flappy.settings import AUDIOS_DIR
+
+
+def pre_init(frequency=44100, buffer=512):
+    # 버퍼가 작을수록 play() 부터 실제 소리가 나기까지가 짧다 (기본값은 환경에 따라 4096 까지 커짐)
+    pygame.mixer.pre_init(frequency, -16, 2, buffer)
+
+
+def _mixer_available():
+    if os.environ.get("SDL_AUDIODRIVER") == "dummy" or os.environ.get("FLAPPY_MUTE") == "1":
+        return False
+    if pygame.mixer.get_init():
+        return True
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        return False
+    return True
+
+
+class AudioManager:
+    def __init__(self, directory=AUDIOS_DIR, channels=8, volume=1.0):
+        self.directory = directory
+        self.volume = volume
+        self.enabled = _mixer_available()
+
+        self.sounds: dict[str, pygame.mixer.Sound] = {}
+        self.played = 0
+        self.stolen = 0  # 빈 채널이 없어서 다른 소리를 끊은 횟수
+        self.skipped = 0  # 소리를 끄거나 없는 이름이라 재생하지 않은 횟수
+
+        self._channels = []
+        self._started = []  # 채널마다 마지막으로 재생을 시작한 순번
+        self._count = 0
+
+        if self.enabled:
+            pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), channels))
+            pygame.mixer.set_reserved(channels)  # find_channel 등 다른 곳에서 이 채널을 쓰지 않게 예약
+            self._channels = [pygame.mixer.Channel(i) for i in range(channels)]
+            self._started = [0] * channels
+            self.load()
+
+    def load(self):
+        # 모든 WAV 를 한 번에 디코딩해둔다 (재생할 때 파일을 읽지 않도록)
+        for file in sorted(self.directory.glob("*.wav")):
+            sound = pygame.mixer.Sound(file)
+            sound.set_volume(self.volume)
+            self.sounds[file.stem] = sound
+        return self.sounds
+
+    def play(self, name):
+        sound = self.sounds.get(name)
+        if sound is None:
+            self.skipped += 1
+            return None
+
+        channel = self._free_channel()
+        channel.play(sound)
+        self.played += 1
+        return channel
+
+    def stop(self):
+        for channel in self._channels:
+            channel.stop()
+
+    def stats(self):
+        return {
+            "enabled": self.enabled,
+            "sounds": len(self.sounds),
+            "channels": len(self._channels),
+            "played": self.played,
+            "stolen": self.stolen,
+            "skipped": self.skipped,
+        }
+
+    def _free_channel(self):
+        # 쉬고 있는 채널이 있으면 그 채널, 없으면 가장 오래 전에 시작한 채널
+        self._count += 1
+        oldest = 0
+        for i, channel in enumerate(self._channels):
+            if not channel.get_busy():
+                self._started[i] = self._count
+                return channel
+            if self._started[i] < self._started[oldest]:
+                oldest = i
+
+        self.stolen += 1
+        self._started[oldest] = self._count
+        channel = self._channels[oldest]
+        channel.stop()
+        return channel
@@ -0,0 +1,260 @@
+# 여러 마리의 새를 NumPy 배열로 한꺼번에 시뮬레이션
+# 모든 새가 같은 파이프들 사이를 날아가고, 새마다 날갯짓 여부만 다르다.
+# 규칙과 계산 순서는 flappy.sim.Simulation 과 같아서, 같은 seed 와 같은 날갯짓이면 결과도 같다.
+# (새마다 날갯짓 프레임을 따로 세고, 파이프 충돌도 flappy.hitmask 의 마스크로 같이 판정한다)
+#
+#   batch = BatchSimulation(1000, seed=1)
+#   while batch.alive.any():
+#       batch.step(autopilot(batch))
+
+import argparse
+import random
+from time import perf_counter
+
+import numpy as np
+
+from flappy.flap import FlapCursors, FlapTiming
+from flappy.hitmask import REDBIRD_FRAMES, pipe_rows
+from flappy.settings import SCREEN_HEIGHT, SCREEN_WIDTH
+from flappy.sim import (
+    BIRD_HEIGHT,
+    BIRD_WIDTH,
+    DEFAULT_RULES,
+    FLOOR_HEIGHT,
+    PIPE_HEIGHT,
+    PIPE_WIDTH,
+    Rules,
+    Simulation,
+    pipe_top,
+)
+
+# death_cause 배열에 저장하는 값
+ALIVE, PIPE, CEILING, FLOOR = 0, 1, 2, 3
+DEATH_CAUSES = {ALIVE: None, PIPE: "pipe", CEILING: "ceiling", FLOOR: "floor"}
+
+MAX_PIPES = 16  # 화면에 동시에 있을 수 있는 파이프 수 (기본 규칙에서는 2~3개)
+
+# 새의 프레임별 마스크 (프레임 번호, 줄). 한 줄은 34비트라서 uint64 에 들어간다
+BIRD_ROWS = np.array(REDBIRD_FRAMES, dtype=np.uint64)
+
+
+class BatchSimulation:
+    def __init__(self, n, seed=None, rules: Rules = DEFAULT_RULES):
+        self.n = n
+        self.rules = rules
+        self.seed = seed
+
+        # 위/아래 파이프 마스크. 새가 파이프 위나 아래로 벗어나도 인덱스가 범위 안에 있도록 위아래에 빈 줄을 붙인다
+        rows = np.array(pipe_rows(rules.gap), dtype=np.uint64)
+        padding = np.zeros(BIRD_HEIGHT, dtype=np.uint64)
+        self.pipe_mask = np.concatenate([padding, rows, padding])
+        self.cursors = FlapCursors(n, len(REDBIRD_FRAMES), FlapTiming())
+
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.seed = seed
+        rules = self.rules
+        n = self.n
+        self.rng = random.Random(self.seed)
+
+        # 새마다 하나씩 (길이 n)
+        self.y = np.full(n, rules.bird_start[1], dtype=np.float64)
+        self.vy = np.zeros(n, dtype=np.float64)
+        self.alive = np.ones(n, dtype=bool)
+        self.score = np.zeros(n, dtype=np.int32)
+        self.frames = np.zeros(n, dtype=np.int32)  # 살아있었던 프레임 수
+        self.death_cause = np.zeros(n, dtype=np.int8)
+        self.bird_frame = np.zeros(n, dtype=np.int32)  # 날갯짓 애니메이션 프레임 (충돌 마스크)
+        self.cursors.reset()
+
+        # 새의 x 위치는 날갯짓과 상관없이 모두 같다
+        self.bird_x = float(rules.bird_start[0])
+        self.bird_vx = 0.0
+
+        # 모든 새가 같이 쓰는 파이프 큐 (앞쪽 count 개만 사용, x 가 작은 순서)
+        self.pipe_x = np.zeros(MAX_PIPES, dtype=np.float64)
+        self.pipe_gap_top = np.zeros(MAX_PIPES, dtype=np.float64)
+        self.pipe_gap_bottom = np.zeros(MAX_PIPES, dtype=np.float64)
+        self.pipe_passed = np.zeros(MAX_PIPES, dtype=bool)
+        self.pipe_count = 0
+
+        self.frame = 0
+
+    def spawn_pipe(self):
+        rules = self.rules
+        if self.pipe_count == MAX_PIPES:
+            raise RuntimeError("파이프가 너무 많습니다. MAX_PIPES 를 늘려주세요.")
+        min_y = rules.pipe_margin
+        max_y = SCREEN_HEIGHT - FLOOR_HEIGHT - rules.pipe_margin
+        center_y = self.rng.uniform(min_y, max_y)
+
+        # flappy.sim.SimPipe 와 같은 계산 (위 파이프 높이 + 간격)
+        top = pipe_top(center_y, rules.gap)
+        i = self.pipe_count
+        self.pipe_x[i] = SCREEN_WIDTH
+        self.pipe_gap_top[i] = top + PIPE_HEIGHT
+        self.pipe_gap_bottom[i] = top + PIPE_HEIGHT + rules.gap
+        self.pipe_passed[i] = False
+        self.pipe_count += 1
+
+    def step(self, flaps):
+        # flaps: 새마다 이번 프레임에 날갯짓할지 (bool 배열, 길이 n)
+        rules = self.rules
+        alive = self.alive
+        self.frame += 1
+
+        flapping = np.flatnonzero(flaps & alive)
+        self.vy[flapping] = -rules.flap_strength
+        self.cursors.release(flapping)
+
+        if self.frame % rules.spawn_interval == 0:
+            self.spawn_pipe()
+
+        # 죽은 새는 그 자리에 멈춰 있는다
+        self.bird_frame[alive] = self.cursors.advance(1, np.flatnonzero(alive))
+        self.vy[alive] += rules.gravity
+        self.y[alive] += self.vy[alive]
+
+        self.bird_vx = rules.bird_enter_speed if self.bird_x < rules.bird_x else 0
+        self.bird_x = min(self.bird_x + self.bird_vx, rules.bird_x)
+
+        count = self.pipe_count
+        self.pipe_x[:count] -= rules.pipe_speed
+        self._drop_offscreen_pipes()
+        count = self.pipe_count
+
+        # 이번 프레임에 죽은 새도 이번 프레임까지는 살아있었던 것으로 센다
+        self.frames[alive] = self.frame
+        # 충돌을 먼저 검사한다 (파이프를 지나가는 프레임에 죽은 새는 점수를 얻지 못함)
+        self._collide()
+        alive = self.alive
+
+        # 점수: 이번 프레임에 새를 지나간 파이프 수만큼 살아있는 새 모두 +1
+        newly_passed = ~self.pipe_passed[:count] & (self.pipe_x[:count] < rules.bird_x)
+        passed = int(newly_passed.sum())
+        if passed:
+            self.pipe_passed[:count] |= newly_passed
+            self.score[alive] += passed
+        return passed
+
+    def _drop_offscreen_pipes(self):
+        count = self.pipe_count
+        drop = int(np.count_nonzero(self.pipe_x[:count] + PIPE_WIDTH <= 0))
+        if drop:
+            for array in (self.pipe_x, self.pipe_gap_top, self.pipe_gap_bottom, self.pipe_passed):
+                array[: count - drop] = array[drop:count]
+            self.pipe_count -= drop
+
+    def _collide(self):
+        # flappy.sim.Simulation.check_collision 처럼 반올림한 위치(rect)로 검사한다 (np.rint 도 round 처럼 짝수 쪽)
+        rules = self.rules
+        y = np.rint(self.y).astype(np.int64)
+        cause = np.zeros(self.n, dtype=np.int8)
+
+        # flappy.sim.Simulation.check_collision 과 같은 우선순위 (파이프 > 천장 > 바닥)
+        cause[y + BIRD_HEIGHT >= rules.floor_y] = FLOOR
+        cause[y + BIRD_HEIGHT < 0] = CEILING
+
+        # 파이프 (x 범위가 새와 겹치는 파이프만)
+        left = round(self.bird_x)
+        right = left + BIRD_WIDTH
+        rows = np.arange(BIRD_HEIGHT)
+        for i in range(self.pipe_count):
+            x = round(self.pipe_x[i])
+            if x >= right:
+                break
+            if x + PIPE_WIDTH <= left:
+                continue
+
+            # 사각형이 위/아래 파이프 부분과 겹치는 새만 마스크로 확인 (구멍 안에 있는 새는 건너뜀)
+            near = np.flatnonzero(
+                self.alive & ((y < self.pipe_gap_top[i]) | (y + BIRD_HEIGHT > self.pipe_gap_bottom[i]))
+            )
+            if not len(near):
+                continue
+
+            # 모든 새의 x 가 같으므로 파이프 마스크를 새 기준으로 한 번만 옮긴다 (flappy.hitmask.overlap 과 같은 계산)
+            dx = left - x
+            shifted = self.pipe_mask >> np.uint64(dx) if dx >= 0 else self.pipe_mask << np.uint64(-dx)
+            top = round(self.pipe_gap_top[i]) - PIPE_HEIGHT
+            index = np.clip(y[near, None] - top + BIRD_HEIGHT + rows, 0, len(self.pipe_mask) - 1)
+            hit = (shifted[index] & BIRD_ROWS[self.bird_frame[near]]).any(axis=1)
+            cause[near[hit]] = PIPE
+
+        died = self.alive & (cause != ALIVE)
+        self.death_cause[died] = cause[died]
+        self.alive &= ~died
+
+    def next_pipe(self):
+        # 아직 새를 지나가지 않은 가장 앞의 파이프 번호 (없으면 None)
+        for i in range(self.pipe_count):
+            if self.pipe_x[i] + PIPE_WIDTH > self.bird_x:
+                return i
+        return None
+
+
+def autopilot(batch: BatchSimulation):
+    # flappy.sim.autopilot 과 같은 규칙을 모든 새에 한꺼번에 적용
+    i = batch.next_pipe()
+    if i is None:
+        target = SCREEN_HEIGHT / 2
+    else:
+        target = batch.pipe_gap_bottom[i] - BIRD_HEIGHT - 10
+    return (batch.y > target) & (batch.vy >= 0)
+
+
+def check_against_scalar(n=64, frames=4000, seed=0):
+    # 자동 조종의 날갯짓을 무작위로 조금씩 뒤집어서 (새마다 다른 프레임에 파이프, 천장, 바닥에 부딪히게)
+    # 배치 결과와 flappy.sim.Simulation 결과가 같은지 확인
+    noise = np.random.default_rng(seed)
+    flip_chance = np.linspace(0.002, 0.1, n)  # 새마다 다르게 (많이 뒤집을수록 천장이나 바닥에 부딪힌다)
+    flaps = np.zeros((frames, n), dtype=bool)
+
+    batch = BatchSimulation(n, seed)
+    for frame in range(frames):
+        flaps[frame] = autopilot(batch) ^ (noise.random(n) < flip_chance)
+        batch.step(flaps[frame])
+
+    for i in range(n):
+        sim = Simulation(seed)
+        for frame in range(frames):
+            if sim.game_over:
+                break
+            sim.step(flap=bool(flaps[frame, i]))
+        expected = (sim.score, sim.frame, sim.death_cause, sim.bird.y)
+        actual = (
+            int(batch.score[i]),
+            int(batch.frames[i]),
+            DEATH_CAUSES[int(batch.death_cause[i])],
+            float(batch.y[i]),
+        )
+        if expected != actual:
+            raise AssertionError(f"bird {i}: scalar {expected} != batch {actual}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="새 여러 마리를 한꺼번에 시뮬레이션해서 속도를 잽니다")
+    parser.add_argument("--birds", type=int, default=10_000)
+    parser.add_argument("--frames", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--check", action="store_true", help="flappy.sim 결과와 같은지 먼저 확인")
+    args = parser.parse_args()
+
+    if args.check:
+        check_against_scalar(seed=args.seed)
+        print("batch == scalar OK")
+
+    batch = BatchSimulation(args.birds, args.seed)
+    start = perf_counter()
+    bird_steps = 0
+    for _ in range(args.frames):
+        bird_steps += int(batch.alive.sum())
+        batch.step(autopilot(batch))
+        if not batch.alive.any():
+            break
+    elapsed = perf_counter() - start
+
+    print(f"{args.birds} birds, {batch.frame} frames in {elapsed:.2f}s")
+    print(f"{bird_steps / elapsed:,.0f} bird-steps/s, alive {int(batch.alive.sum())}, best score {int(batch.score.max())}")
@@ -0,0 +1,88 @@
+from bisect import bisect_left
+from typing import NamedTuple
+
+from pygame.sprite import Group, Sprite
+
+
+class Hit(NamedTuple):
+    sprite: Sprite  # 부딪힌 장애물
+    point: tuple[int, int]  # 처음 겹친 픽셀의 화면 좌표
+
+
+def _left(sprite):
+    return sprite.rect.left
+
+
+def mask_hit(obstacle, sprite) -> Hit | None:
+    # rect 가 겹치는 두 스프라이트를 마스크로 검사해서 처음 겹친 픽셀을 돌려준다
+    rect = sprite.rect
+    offset = (rect.x - obstacle.rect.x, rect.y - obstacle.rect.y)
+    point = obstacle.mask.overlap(sprite.mask, offset)
+    if point is None:
+        return None
+    return Hit(obstacle, (obstacle.rect.x + point[0], obstacle.rect.y + point[1]))
+
+
+class CollisionGroup(Group):
+    # 장애물(파이프)만 모아두는 그룹.
+    # 장애물을 x 좌표 순서로 정렬해두고 새의 rect 와 x 범위가 겹치는 것만 마스크로 검사한다.
+    # 그래서 장애물이 아무리 많아도 검사하는 개수는 새 근처의 파이프 몇 개로 일정하다.
+
+    def __init__(self, *sprites):
+        self._ordered: list[Sprite] = []
+        self._added: list[Sprite] = []  # 폭을 아직 반영하지 않은 새 장애물
+        self._max_width = 0
+
+        # 이번 프레임 검사 횟수
+        self.queries = 0
+        self.broad_tests = 0  # rect 로 걸러낸 후보 수
+        self.narrow_tests = 0  # 마스크까지 검사한 수
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self._ordered.append(sprite)
+        self._added.append(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._ordered.remove(sprite)
+        if sprite in self._added:
+            self._added.remove(sprite)
+
+    def begin_frame(self):
+        # 프레임마다 한 번 호출: 카운터를 초기화하고 x 순서를 다시 맞춘다
+        # (모든 파이프가 같은 속도로 움직이면 이미 정렬되어 있어서 비용이 거의 없다)
+        for sprite in self._added:
+            self._max_width = max(self._max_width, sprite.rect.width)
+        self._added.clear()
+
+        self._ordered.sort(key=_left)
+        self.queries = self.broad_tests = self.narrow_tests = 0
+
+    def query(self, sprite) -> Hit | None:
+        self.queries += 1
+        rect = sprite.rect
+
+        # 왼쪽 끝이 [새 왼쪽 - 가장 넓은 장애물 폭, 새 오른쪽) 안에 있는 장애물만 후보
+        start = bisect_left(self._ordered, rect.left - self._max_width, key=_left)
+        end = bisect_left(self._ordered, rect.right, key=_left)
+
+        for obstacle in self._ordered[start:end]:
+            self.broad_tests += 1
+            if not obstacle.rect.colliderect(rect):
+                continue
+
+            self.narrow_tests += 1
+            hit = mask_hit(obstacle, sprite)
+            if hit is not None:
+                return hit
+        return None
+
+    def stats(self):
+        return {
+            "obstacles": len(self._ordered),
+            "queries": self.queries,
+            "broad_tests": self.broad_tests,
+            "narrow_tests": self.narrow_tests,
+        }
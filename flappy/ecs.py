@@ -0,0 +1,216 @@
+# 배열(NumPy) 기반 엔티티 저장소 (entity-component system)
+#
+# 스프라이트 객체를 하나씩 만들고 update() 를 하나씩 부르는 대신,
+# 위치/속도/이미지/레이어를 엔티티 번호로 찾는 배열(열, column)에 저장하고
+# 시스템(move, wrap, cull, draw)이 모든 엔티티를 한 번에 처리한다.
+# 새나 파이프가 수백 개 있어도 Python 코드는 엔티티 수가 아니라 시스템 수만큼만 실행된다.
+#
+#   world = World()
+#   pipe = world.spawn(pipe_image, x=288, y=100, vx=-2, layer=Layer.OBSTACLE, cull=True)
+#   world.move(steps(dt))    # 속도, 가속도 적용
+#   world.cull()             # 화면 왼쪽으로 나간 엔티티 제거
+#   world.draw(screen)       # 레이어 순서대로 surface.blits 한 번으로 그리기
+#
+# 기존 LayeredUpdates 로 그리고 싶으면 view(entity) 로 만든 SpriteView 를 그룹에 넣고
+# 그리기 전에 world.sync_views() 를 호출한다.
+
+import numpy as np
+import pygame
+from pygame.sprite import Sprite
+
+from flappy.settings import SCREEN_HEIGHT, SCREEN_WIDTH
+
+
+class SpriteView(Sprite):
+    # 엔티티 하나를 LayeredUpdates 에서 그릴 수 있게 보여주는 스프라이트 (위치는 world.sync_views() 로 맞춘다)
+
+    def __init__(self, world, entity, *groups):
+        self.world = world
+        self.entity = entity
+        self._layer = int(world.layer[entity])
+        self.image = world.images[world.image[entity]]
+        self.rect = self.image.get_rect(topleft=(round(world.x[entity]), round(world.y[entity])))
+        super().__init__(*groups)
+
+
+class World:
+    def __init__(self, capacity=64):
+        self.capacity = 0
+        self.count = 0  # 살아있는 엔티티 수
+        self.high = 0  # 지금까지 쓴 가장 큰 엔티티 번호 + 1 (시스템은 이 범위만 처리)
+        self._free: list[int] = []  # 다시 쓸 수 있는 엔티티 번호
+
+        # 이미지 표 (엔티티에는 이미지 번호만 저장)
+        self.images: list[pygame.Surface] = []
+        self._masks: list[pygame.mask.Mask | None] = []
+        self._image_ids: dict[int, int] = {}
+
+        self.views: dict[int, SpriteView] = {}
+
+        self._columns = {
+            "alive": np.bool_,
+            "x": np.float64,
+            "y": np.float64,
+            "vx": np.float64,
+            "vy": np.float64,
+            "ay": np.float64,  # 세로 가속도 (중력)
+            "wrap": np.float64,  # 0 이 아니면 x 가 -wrap 이하가 될 때 wrap 만큼 되돌림 (흘러가는 배경)
+            "image": np.int32,
+            "width": np.int32,
+            "height": np.int32,
+            "layer": np.int16,
+            "cull_left": np.bool_,  # 화면 왼쪽으로 완전히 나가면 cull() 에서 제거
+        }
+        for name, dtype in self._columns.items():
+            setattr(self, name, np.zeros(0, dtype))
+        self._grow(capacity)
+
+    # 이미지
+
+    def image_id(self, surface):
+        # 같은 Surface 는 같은 번호 (모든 파이프가 이미지 하나를 같이 쓴다)
+        index = self._image_ids.get(id(surface))
+        if index is None:
+            index = self._image_ids[id(surface)] = len(self.images)
+            self.images.append(surface)
+            self._masks.append(None)
+        return index
+
+    def mask(self, image_id):
+        mask = self._masks[image_id]
+        if mask is None:
+            mask = self._masks[image_id] = pygame.mask.from_surface(self.images[image_id])
+        return mask
+
+    # 엔티티
+
+    def spawn(self, image, x=0.0, y=0.0, vx=0.0, vy=0.0, ay=0.0, layer=0, wrap=0.0, cull=False):
+        if self._free:
+            entity = self._free.pop()
+        else:
+            if self.high == self.capacity:
+                self._grow(self.capacity * 2)
+            entity = self.high
+            self.high += 1
+
+        image_id = self.image_id(image)
+        self.alive[entity] = True
+        self.x[entity] = x
+        self.y[entity] = y
+        self.vx[entity] = vx
+        self.vy[entity] = vy
+        self.ay[entity] = ay
+        self.wrap[entity] = wrap
+        self.image[entity] = image_id
+        self.width[entity], self.height[entity] = image.get_size()
+        self.layer[entity] = layer
+        self.cull_left[entity] = cull
+        self.count += 1
+        return entity
+
+    def set_image(self, entity, image):
+        self.image[entity] = self.image_id(image)
+        self.width[entity], self.height[entity] = image.get_size()
+
+    def despawn(self, entity):
+        if not self.alive[entity]:
+            return
+        self.alive[entity] = False
+        self._free.append(entity)
+        self.count -= 1
+
+        view = self.views.pop(entity, None)
+        if view is not None:
+            view.kill()
+
+    def entities(self):
+        return np.flatnonzero(self.alive[: self.high])
+
+    def clear(self):
+        for entity in self.entities().tolist():
+            self.despawn(entity)
+
+    # 시스템
+
+    def move(self, k=1.0):
+        # 60Hz 기준 k 프레임만큼 진행 (flappy.loop.steps). 가속도는 Body.step 과 같은 식이라 주기와 상관없다
+        n = self.high
+        alive = self.alive[:n]
+        ay = self.ay[:n] * alive
+        vy = self.vy[:n]
+        self.x[:n] += self.vx[:n] * k * alive
+        self.y[:n] += (vy * k + ay * (k * (k + 1) / 2)) * alive
+        vy += ay * k
+
+    def wrap_around(self):
+        n = self.high
+        wrap = self.wrap[:n]
+        x = self.x[:n]
+        wrapped = (wrap > 0) & (x <= -wrap)
+        x[wrapped] += wrap[wrapped]
+
+    def cull(self, left=0):
+        # 화면 왼쪽으로 완전히 나간 엔티티를 제거하고, 제거한 번호를 돌려준다
+        n = self.high
+        gone = np.flatnonzero(self.alive[:n] & self.cull_left[:n] & (self.x[:n] + self.width[:n] <= left))
+        for entity in gone.tolist():
+            self.despawn(entity)
+        return gone
+
+    def visible(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        # 화면과 겹치는 엔티티를 레이어 순서(같은 레이어는 만든 순서)로
+        n = self.high
+        x, y = self.x[:n], self.y[:n]
+        on_screen = (
+            self.alive[:n]
+            & (x < width)
+            & (x + self.width[:n] > 0)
+            & (y < height)
+            & (y + self.height[:n] > 0)
+        )
+        entities = np.flatnonzero(on_screen)
+        return entities[np.argsort(self.layer[entities], kind="stable")]
+
+    def draw(self, surface):
+        entities = self.visible(*surface.get_size())
+        xs = np.rint(self.x[entities]).astype(np.int32).tolist()
+        ys = np.rint(self.y[entities]).astype(np.int32).tolist()
+        images = self.images
+        surface.blits(
+            [(images[i], (x, y)) for i, x, y in zip(self.image[entities].tolist(), xs, ys)],
+            doreturn=False,
+        )
+        return len(entities)
+
+    # LayeredUpdates 연결
+
+    def view(self, entity, *groups) -> SpriteView:
+        view = self.views.get(entity)
+        if view is None:
+            view = self.views[entity] = SpriteView(self, entity, *groups)
+        else:
+            view.add(*groups)
+        return view
+
+    def sync_views(self):
+        # 배열의 위치와 이미지를 SpriteView 의 rect / image 에 옮긴다 (그리기 직전에 한 번)
+        if not self.views:
+            return
+        entities = np.fromiter(self.views, np.int64, len(self.views))
+        xs = np.rint(self.x[entities]).astype(np.int32).tolist()
+        ys = np.rint(self.y[entities]).astype(np.int32).tolist()
+        widths = self.width[entities].tolist()
+        heights = self.height[entities].tolist()
+        image_ids = self.image[entities].tolist()
+        images = self.images
+        for view, x, y, w, h, image_id in zip(self.views.values(), xs, ys, widths, heights, image_ids):
+            view.image = images[image_id]
+            view.rect.update(x, y, w, h)
+
+    def _grow(self, capacity):
+        for name in self._columns:
+            old = getattr(self, name)
+            new = np.zeros(capacity, old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
+        self.capacity = capacity
@@ -0,0 +1,102 @@
+# 날갯짓 애니메이션 커서: 새마다 지금 몇 번째 프레임인지만 계산한다 (이미지는 flappy.animation 의 FrameTable)
+# pygame 없이 동작하므로 창 없는 시뮬레이션(flappy.sim, flappy.batch)도 게임과 같은 프레임(= 같은 충돌 마스크)을 쓴다.
+#
+#   cursor = FlapCursor(4)
+#   cursor.release()                       # space 를 뗀 순간
+#   index = cursor.advance(k, flapping)    # k: 60Hz 기준 진행한 프레임 수 (flappy.loop.steps)
+#
+# 여러 마리를 NumPy 배열로 한꺼번에 움직일 때는 FlapCursors 를 쓴다 (flappy.flock, flappy.batch).
+
+from dataclasses import dataclass
+
+import numpy as np
+
+# 주기에 따라 k 가 0.5 처럼 딱 떨어지지 않으면 (0.1 을 열 번 더하면 0.9999...) 조금 모자라도 넘어간 것으로 본다
+EPSILON = 1e-9
+
+
+@dataclass(frozen=True)
+class FlapTiming:
+    # 값은 모두 60Hz 한 프레임 기준 (Bird.ANIMATION_SPEED, FLAP_ANIMATION_SPEED, FLAP_DURATION)
+    animation_speed: float = 0.0  # 날갯짓하지 않을 때 속도. 0 이면 첫 프레임(날개 접힘)에 멈춘다
+    flap_animation_speed: float = 0.2  # 날갯짓할 때 속도 (프레임마다 커서가 넘어가는 정도)
+    flap_duration: float = 15  # 날갯짓을 끝낸 뒤에도 날개를 계속 움직이는 프레임 수
+
+
+class FlapCursor:
+    # 새 한 마리의 애니메이션 상태. 이미지 대신 프레임 번호만 갖는다.
+    __slots__ = ("timing", "length", "index", "timer", "flap_timer")
+
+    def __init__(self, length, timing: FlapTiming = FlapTiming()):
+        self.timing = timing
+        self.length = length
+        self.reset()
+
+    def reset(self):
+        self.index = 0
+        self.timer = 0.0
+        self.flap_timer = 0.0
+
+    def release(self):
+        # 날갯짓(space)을 끝낸 순간. 이후 flap_duration 동안 날개를 계속 움직인다
+        self.flap_timer = self.timing.flap_duration
+
+    def advance(self, k, flapping=False):
+        timing = self.timing
+        if flapping or self.flap_timer > EPSILON:
+            speed = timing.flap_animation_speed
+            if not flapping:
+                self.flap_timer -= k
+        elif timing.animation_speed:
+            speed = timing.animation_speed
+        else:
+            self.index = 0
+            self.timer = 0.0
+            return 0
+
+        self.timer += speed * k
+        if self.timer >= 1 - EPSILON:
+            self.timer = 0.0
+            self.index = (self.index + 1) % self.length
+        return self.index
+
+
+class FlapCursors:
+    # FlapCursor 여러 개를 배열로 (flappy.flock 의 새마다 한 칸)
+
+    def __init__(self, n, length, timing: FlapTiming = FlapTiming()):
+        self.timing = timing
+        self.length = length
+        self.index = np.zeros(n, dtype=np.int32)
+        self.timer = np.zeros(n, dtype=np.float64)
+        self.flap_timer = np.zeros(n, dtype=np.float64)
+
+    def reset(self):
+        self.index[:] = 0
+        self.timer[:] = 0
+        self.flap_timer[:] = 0
+
+    def release(self, rows):
+        self.flap_timer[rows] = self.timing.flap_duration
+
+    def advance(self, k, rows):
+        # rows 번째 커서만 진행하고 그 커서들의 프레임 번호를 돌려준다 (FlapCursor.advance 와 같은 규칙)
+        timing = self.timing
+        flap_timer = self.flap_timer[rows]
+        flapping = flap_timer > EPSILON
+        self.flap_timer[rows] = np.where(flapping, flap_timer - k, flap_timer)
+
+        speed = np.where(flapping, timing.flap_animation_speed, timing.animation_speed)
+        timer = self.timer[rows] + speed * k
+        index = self.index[rows]
+        advance = timer >= 1 - EPSILON
+        timer[advance] = 0
+        index = np.where(advance, (index + 1) % self.length, index)
+
+        resting = speed == 0
+        timer[resting] = 0
+        index[resting] = 0
+
+        self.timer[rows] = timer
+        self.index[rows] = index
+        return index
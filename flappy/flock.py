@@ -0,0 +1,261 @@
+# 여러 마리의 새가 같은 파이프 사이를 함께 날아가는 모드 (AI 평가, 고스트 레이스)
+#
+# 새는 flappy.ecs.World 의 엔티티로 저장하고, 물리/애니메이션/충돌을 모든 새에 한꺼번에 계산한다.
+# 모든 새가 날갯짓 프레임 표(flappy.animation)의 이미지와 마스크를 같이 쓰고, 죽은 새는 world 에서 빠지므로
+# 더 이상 움직이거나 그려지지 않는다.
+#
+#   flock = Flock(500)
+#   flock.step(flaps, dt, lane)     # flaps: 새마다 이번에 날갯짓하는지 (bool 배열)
+#   renderer = Renderer(screen, sprites, overlays=[flock])
+#
+#   python -m flappy.flock --birds 500    # 자동 조종하는 새 500 마리를 화면에 띄워본다
+
+import argparse
+import random
+from functools import partial
+
+import numpy as np
+import pygame
+from pygame import Rect
+
+from flappy.assets import asset_manager
+from flappy.batch import ALIVE, CEILING, FLOOR, PIPE
+from flappy.ecs import World
+from flappy.flap import FlapCursors, FlapTiming
+from flappy.lane import PipeLane
+from flappy.loop import steps
+from flappy.settings import SCREEN_HEIGHT, SCREEN_WIDTH
+from flappy.sim import DEFAULT_RULES, Rules
+from flappy.sprites import Bird, Layer
+
+
+class Flock:
+    def __init__(self, n, rules: Rules = DEFAULT_RULES):
+        self.n = n
+        self.rules = rules
+        self.world = World(capacity=n)
+
+        # 모든 새가 Bird 와 같은 날갯짓 프레임 표를 같이 쓰고, 새마다 커서(프레임 번호)만 갖는다
+        self.frames = asset_manager.frames("redbird")
+        self.frame_ids = np.array([self.world.image_id(frame) for frame in self.frames.frames], dtype=np.int32)
+        self.width, self.height = self.frames.frames[0].get_size()
+        self.cursors = FlapCursors(
+            n, len(self.frames), FlapTiming(Bird.ANIMATION_SPEED, Bird.FLAP_ANIMATION_SPEED, Bird.FLAP_DURATION)
+        )
+
+        self.reset()
+
+    def reset(self):
+        rules = self.rules
+        n = self.n
+        self.world.clear()
+
+        # 새 번호 i 의 엔티티 번호
+        x, y = rules.bird_start
+        self.entity = np.array(
+            [self.world.spawn(self.frames.frames[0], x, y, ay=rules.gravity, layer=Layer.PLAYER) for _ in range(n)],
+            dtype=np.int64,
+        )
+        self.alive = np.ones(n, dtype=bool)
+        self.score = np.zeros(n, dtype=np.int32)
+        self.frames_alive = np.zeros(n, dtype=np.int32)
+        self.death_cause = np.zeros(n, dtype=np.int8)
+        self.cursors.reset()
+
+    @property
+    def alive_count(self):
+        return int(np.count_nonzero(self.alive))
+
+    def y(self):
+        return self.world.y[self.entity]
+
+    def vy(self):
+        return self.world.vy[self.entity]
+
+    def step(self, flaps, dt, lane: PipeLane):
+        # flaps 는 길이 n 의 bool 배열 (죽은 새의 값은 무시)
+        # 파이프(lane)는 이 함수 전에 update 되어 있어야 한다
+        rules = self.rules
+        world = self.world
+        k = steps(dt)
+
+        alive = np.flatnonzero(self.alive)
+        if not len(alive):
+            return 0
+        entity = self.entity[alive]
+
+        flapping = np.asarray(flaps, dtype=bool)[alive]
+        world.vy[entity[flapping]] = -rules.flap_strength
+        self.cursors.release(alive[flapping])
+
+        # 시작 위치까지 날아오기 (모든 새의 x 는 같다)
+        world.vx[entity] = np.where(world.x[entity] < rules.bird_x, rules.bird_enter_speed, 0.0)
+        world.move(k)
+        world.x[entity] = np.minimum(world.x[entity], rules.bird_x)
+        self._animate(alive, k)
+
+        self.frames_alive[alive] += 1
+
+        # 충돌을 먼저 검사한다 (파이프를 지나가는 프레임에 죽은 새는 점수를 얻지 못함. Game.step 과 같은 순서)
+        self._collide(alive, lane)
+        passed = lane.collect_passed(rules.bird_x)
+        self.score[self.alive] += passed
+        return passed
+
+    def _animate(self, alive, k):
+        # 날갯짓한 뒤 FLAP_DURATION 프레임 동안만 날개를 움직이고, 아니면 첫 번째 프레임
+        index = self.cursors.advance(k, alive)
+        self.world.image[self.entity[alive]] = self.frame_ids[index]
+
+    def _collide(self, alive, lane):
+        world = self.world
+        entity = self.entity[alive]
+        x = np.rint(world.x[entity]).astype(np.int32)
+        y = np.rint(world.y[entity]).astype(np.int32)
+        dead = np.zeros(len(alive), dtype=np.int8)
+
+        # 천장, 바닥 (Bird.check_collision 과 같은 규칙)
+        dead[y + self.height < 0] = CEILING
+        dead[y + self.height >= self.rules.floor_y] = FLOOR
+
+        # 새들과 x 가 겹치는 파이프만 (보통 1~2개)
+        left, right = int(x.min()), int(x.max()) + self.width
+        for pipe in lane.lane:
+            rect = pipe.rect
+            if rect.left >= right:
+                break
+            if rect.right <= left:
+                continue
+
+            # 사각형이 위/아래 파이프 부분과 겹치는 새만 마스크로 확인 (구멍 안에 있는 새는 건너뜀)
+            gap_top = round(pipe.gap_top())
+            gap_bottom = gap_top + pipe.gap
+            near = np.flatnonzero(
+                (dead == ALIVE)
+                & (x < rect.right)
+                & (x + self.width > rect.left)
+                & ((y < gap_top) | (y + self.height > gap_bottom))
+            )
+            masks = self.frames.masks
+            indices = self.cursors.index[alive[near]].tolist()
+            for i, bx, by, index in zip(near.tolist(), x[near].tolist(), y[near].tolist(), indices):
+                if pipe.mask.overlap(masks[index], (bx - rect.x, by - rect.y)) is not None:
+                    dead[i] = PIPE
+
+        died = np.flatnonzero(dead)
+        if len(died):
+            birds = alive[died]
+            self.alive[birds] = False
+            self.death_cause[birds] = dead[died]
+            for entity in self.entity[birds].tolist():
+                world.despawn(entity)
+        return len(died)
+
+    def draw(self, surface):
+        # Renderer 의 overlay 로 쓸 때: 살아있는 새를 모두 그리고 새들이 있는 영역을 돌려준다
+        if not self.alive.any():
+            return None
+        self.world.draw(surface)
+        entity = self.entity[self.alive]
+        x = np.rint(self.world.x[entity])
+        y = np.rint(self.world.y[entity])
+        return Rect(int(x.min()), int(y.min()), int(x.max() - x.min()) + self.width, int(y.max() - y.min()) + self.height)
+
+    def stats(self):
+        return {
+            "birds": self.n,
+            "alive": self.alive_count,
+            "best_score": int(self.score.max()) if self.n else 0,
+            "mean_frames": float(self.frames_alive.mean()) if self.n else 0.0,
+            "deaths": {
+                "pipe": int(np.count_nonzero(self.death_cause == PIPE)),
+                "ceiling": int(np.count_nonzero(self.death_cause == CEILING)),
+                "floor": int(np.count_nonzero(self.death_cause == FLOOR)),
+            },
+        }
+
+
+def autopilot(flock: Flock, lane: PipeLane, margins):
+    # flappy.sim.autopilot 과 같은 규칙. 새마다 목표 높이(margins)를 조금씩 달리해서 서로 다르게 날게 한다
+    next_pipe = None
+    for pipe in lane.lane:
+        if pipe.rect.right > flock.rules.bird_x:
+            next_pipe = pipe
+            break
+    if next_pipe is None:
+        target = SCREEN_HEIGHT / 2 - margins
+    else:
+        target = next_pipe.gap_bottom() - flock.height - margins
+    return (flock.y() > target) & (flock.vy() >= 0)
+
+
+if __name__ == "__main__":
+    from pygame.sprite import LayeredUpdates
+
+    from flappy.headless import open_window
+    from flappy.loop import GameLoop
+    from flappy.pipe_pool import PipePool
+    from flappy.profiler import FrameProfiler, ProfilerOverlay
+    from flappy.render import Renderer
+    from flappy.scheduler import Scheduler
+    from flappy.sprites import Pipe, ScrollLayer
+
+    parser = argparse.ArgumentParser(description="자동 조종하는 새 여러 마리가 같은 파이프 사이를 날아갑니다")
+    parser.add_argument("--birds", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--seconds", type=float, default=0, help="0 이면 창을 닫을 때까지")
+    args = parser.parse_args()
+
+    assets = asset_manager
+    screen = open_window((SCREEN_WIDTH, SCREEN_HEIGHT), f"Flappy Bird x {args.birds}", icon=assets.icon())
+    assets.warmup()
+    rules = DEFAULT_RULES
+
+    sprites = LayeredUpdates()
+    lane = PipeLane()
+    rng = random.Random(args.seed)
+    pipe_pool = PipePool(partial(Pipe, rng=rng), capacity=8)
+    sky = ScrollLayer(assets.sprite("background"), rules.background_speed)
+    floor_image = assets.sprite("floor")
+    floor = ScrollLayer(
+        floor_image, rules.pipe_speed, SCREEN_HEIGHT - floor_image.get_height(), Layer.FLOOR, sprites
+    )
+
+    flock = Flock(args.birds, rules)
+    margins = np.random.default_rng(args.seed).uniform(-5, 40, args.birds)
+
+    scheduler = Scheduler()
+    scheduler.every(rules.spawn_interval / 60, lambda: pipe_pool.acquire(sprites, lane), tag="spawn")
+
+    profiler = FrameProfiler()
+    overlay = ProfilerOverlay(profiler, visible=True)
+    renderer = Renderer(screen, sprites, layers=[sky], overlays=[flock, overlay])
+
+    def handle_events():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                game_loop.stop()
+
+    def update(dt):
+        scheduler.advance(dt)
+        with profiler.section("update"):
+            sky.update(dt)
+            sprites.update(dt)
+        with profiler.section("collision"):
+            flock.step(autopilot(flock, lane, margins), dt, lane)
+        if not flock.alive.any() or (args.seconds and game_loop.ticks >= args.seconds * 60):
+            game_loop.stop()
+
+    def render(alpha):
+        with profiler.section("draw"):
+            rects = renderer.draw()
+        with profiler.section("flip"):
+            renderer.present(rects)
+
+    game_loop = GameLoop(max_fps=60, profiler=profiler)
+    game_loop.run(handle_events, update, render)
+
+    stats = profiler.stats()
+    print(flock.stats())
+    print(f"{stats['fps']:.1f} fps, p99 {stats['p99_ms']:.2f} ms, phases {stats['phases_ms']}")
+    pygame.quit()
@@ -0,0 +1,129 @@
+# 한 판의 게임 규칙: 새, 파이프, 충돌, 점수를 시뮬레이션 주기(tick_rate)마다 진행한다.
+# main2-4-Pipe.py 와 리플레이 재생(flappy.replay.play)이 이 코드 하나로 게임을 진행하므로 결과가 같다.
+# 그리기, 소리, 시작/게임 오버 화면 전환은 하지 않는다.
+#
+#   game = Game(sprites, tick_rate=120)
+#   game.start(seed)
+#   game.handle_event(event)     # space 키 (리플레이에도 기록)
+#   passed = game.step(dt)       # 이번 프레임에 지나간 파이프 수 (dt = 1 / tick_rate)
+#   if game.game_over: ...
+#   game.reset()                 # 다시 시작할 때 (스프라이트를 새로 만들지 않음)
+
+import random
+from functools import partial
+
+import pygame
+
+from flappy.lane import PipeLane
+from flappy.loop import REFERENCE_RATE, steps
+from flappy.pipe_pool import PipePool
+from flappy.profiler import FrameProfiler
+from flappy.replay import Replay
+from flappy.scheduler import Scheduler
+from flappy.sim import DEFAULT_RULES as RULES
+from flappy.sprites import Bird, Pipe
+from flappy.trace import NULL_TRACER
+
+# 파이프는 pygame 타이머가 아니라 시뮬레이션 시간으로 생성한다 (느려지거나 빨라져도 간격이 같음)
+PIPE_SPAWN_INTERVAL = RULES.spawn_interval / REFERENCE_RATE  # 파이프 생성 간격 (초, 1.5초마다)
+
+
+class Game:
+    def __init__(self, sprites, profiler: FrameProfiler | None = None, tracer=NULL_TRACER, tick_rate=REFERENCE_RATE):
+        self.sprites = sprites
+        self.tick_rate = tick_rate  # 1초에 몇 번 step 하는지 (리플레이에 같이 저장)
+        self.profiler = profiler if profiler is not None else FrameProfiler(enabled=False)
+        self.tracer = tracer
+
+        self.bird = Bird(sprites)
+        # 파이프는 나온 순서(= x 순서)대로 lane 에 모아두고 충돌, 점수는 lane 으로만 검사한다
+        self.obstacles = PipeLane()
+
+        # 게임 seed 로 정해지는 난수. 같은 seed 면 파이프가 같은 위치에 나온다
+        self.seed = 0
+        self.rng = random.Random(self.seed)
+        # 파이프는 매번 새로 만들지 않고 풀에서 꺼내 쓴다
+        self.pipe_pool = PipePool(partial(Pipe, rng=self.rng), capacity=8)
+        self.scheduler = Scheduler()
+
+        self.replay = Replay(self.seed, tick_rate=tick_rate)
+        self.frame = 0  # 이번 게임에서 진행한 시뮬레이션 횟수 (리플레이 기록용)
+        self.score = 0
+        self.game_over = False
+        self.death_cause = None  # "pipe", "ceiling", "floor" (flappy.sim 과 같음)
+
+    def start(self, seed):
+        # 게임 시작. 타이머도 게임마다 새로 만들어서 앞 게임에서 흐른 시간이 생성 시각에 섞이지 않게 한다
+        self.seed = seed
+        self.rng.seed(seed)
+        self.replay = Replay(seed, tick_rate=self.tick_rate)
+        self.frame = 0
+        self.scheduler = Scheduler()
+        self.scheduler.every(PIPE_SPAWN_INTERVAL, self.spawn_pipe, tag="spawn")
+
+    def reset(self):
+        # 처음 상태로 되돌린다 (새, 파이프, 점수)
+        self.bird.reset()
+        for pipe in self.obstacles.sprites():
+            self.pipe_pool.release(pipe)
+        self.score = 0
+        self.game_over = False
+        self.death_cause = None
+
+    def spawn_pipe(self):
+        pipe = self.pipe_pool.acquire(self.sprites, self.obstacles)
+        # 생성된 파이프는 같은 step 에서 한 번 움직인다. 60Hz 에서 한 프레임(SPEED) 움직인 것과 같은 위치가 되도록
+        # 주기가 빨라서 덜 움직이는 만큼 미리 옮겨둔다 (60Hz 이면 0)
+        pipe.body.x -= pipe.SPEED * (1 - steps(1 / self.tick_rate))
+        self.tracer.instant("pipe spawn", {"frame": self.frame})
+        return pipe
+
+    def handle_event(self, event):
+        if self.game_over:
+            return
+        if event.type in (pygame.KEYDOWN, pygame.KEYUP) and event.key == pygame.K_SPACE:
+            self.replay.record(self.frame, event.type == pygame.KEYDOWN)
+        self.bird.handle_event(event)
+
+    def step(self, dt):
+        # 한 프레임 진행하고 이번 프레임에 새가 지나간 파이프 수를 돌려준다.
+        # 게임 오버 후에도 새가 떨어지는 것은 보여주지만 충돌, 점수는 검사하지 않는다.
+        profiler = self.profiler
+        with profiler.section("update"):
+            self.frame += 1
+            self.scheduler.advance(dt)
+
+            if self.tracer.enabled:
+                # 어느 스프라이트의 update 가 오래 걸리는지 보이도록 하나씩 기록한다
+                for sprite in self.sprites.sprites():
+                    with self.tracer.span(type(sprite).__name__, "update"):
+                        sprite.update(dt)
+            else:
+                self.sprites.update(dt)
+
+        if self.game_over:
+            return 0
+
+        with profiler.section("collision"):
+            self.obstacles.begin_frame()
+            hit = self.bird.check_collision(self.obstacles)
+
+        # 충돌을 먼저 검사한다 (파이프를 지나가는 프레임에 죽으면 점수를 얻지 못함)
+        if hit:
+            self.game_over = True
+            self.death_cause = self._death_cause()
+            self.scheduler.pause("spawn")
+            return 0
+
+        # 새가 지나간 파이프 (보통 0개, 가끔 1개)
+        passed = self.obstacles.collect_passed(RULES.bird_x)
+        self.score += passed
+        return passed
+
+    def _death_cause(self):
+        bird = self.bird
+        if bird.hit is not None:
+            return "pipe"
+        if bird.rect.bottom < 0:
+            return "ceiling"
+        return "floor"
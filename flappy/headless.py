@@ -0,0 +1,63 @@
+# 화면(모니터)이 없는 환경에서 pygame 을 쓰기 위한 도우미
+# CI 서버처럼 디스플레이가 없으면 SDL 의 dummy 드라이버로 대신 창을 만든다.
+# (dummy 드라이버에서도 Surface 에 그리기, blit, 마스크 등은 모두 똑같이 동작한다)
+#
+#   FLAPPY_HEADLESS=1 python main2-4-Pipe.py   # 강제로 창 없이 실행
+
+import os
+import sys
+
+import pygame
+
+from flappy.settings import SCREEN_HEIGHT, SCREEN_WIDTH, TITLE
+
+
+def has_display():
+    if os.environ.get("FLAPPY_HEADLESS") == "1":
+        return False
+    if sys.platform.startswith("linux"):
+        return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+    return True
+
+
+def use_dummy_drivers():
+    # pygame.init() 전에 호출해야 한다. 이미 드라이버를 지정했다면 그대로 둔다.
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def open_window(size, title=TITLE, icon=None):
+    # 창을 연다. 디스플레이가 없거나 창을 만들 수 없으면 dummy 드라이버로 다시 시도한다.
+    # icon 은 창이 만들어지기 전에 설정해야 하는 시스템이 있어서 set_mode 전에 설정한다.
+    if not has_display():
+        use_dummy_drivers()
+
+    pygame.init()
+    pygame.display.set_caption(title)
+    if icon is not None:
+        pygame.display.set_icon(icon)
+    try:
+        return pygame.display.set_mode(size)
+    except pygame.error:
+        pygame.display.quit()
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        pygame.display.init()
+        pygame.display.set_caption(title)
+        if icon is not None:
+            pygame.display.set_icon(icon)
+        return pygame.display.set_mode(size)
+
+
+def offscreen_display(size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+    # 그리지 않고 게임만 돌릴 때 (리플레이 재생 등). 스프라이트를 화면 포맷으로 바꾸려면 set_mode 가 필요하므로
+    # 아직 화면이 없으면 dummy 드라이버로 만든다. 이미 창이 있으면 그 화면을 그대로 쓴다.
+    surface = pygame.display.get_surface()
+    if surface is not None:
+        return surface
+    use_dummy_drivers()
+    pygame.display.init()
+    return pygame.display.set_mode(size)
+
+
+def is_headless():
+    return pygame.display.get_driver() in ("dummy", "offscreen")
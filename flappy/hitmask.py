@@ -0,0 +1,174 @@
+# 충돌 마스크를 pygame 없이 쓰기 위한 줄(row) 단위 비트마스크 (flappy.sim, flappy.batch)
+# 한 줄을 정수 하나로 나타낸다: 왼쪽에서 x 번째 픽셀이 불투명하면 (1 << x) 비트가 1.
+# 값은 게임이 쓰는 마스크(pygame.mask.from_surface)와 같아서 창 없는 시뮬레이션도 게임과 같은 프레임에 부딪힌다.
+#
+#   rows = pipe_rows(gap)                                     # 위/아래 파이프를 합친 마스크 (Pipe.mask)
+#   overlap(rows, REDBIRD_FRAMES[index], dx, dy)              # 새 rect 가 파이프 rect 에서 (dx, dy) 떨어져 있을 때
+#
+#   python -m flappy.hitmask            # assets/sprites 이미지로 새 그림을 다시 만들어 출력 (이미지를 바꿨을 때)
+#   python -m flappy.hitmask --check    # 이 파일의 값이 게임의 마스크(flappy.assets)와 같은지 확인
+
+import argparse
+
+
+def _rows(picture):
+    # "#" 는 불투명한 픽셀, "." 은 투명한 픽셀 (한 줄에 한 행)
+    return tuple(sum(1 << x for x, pixel in enumerate(line) if pixel == "#") for line in picture.split())
+
+
+# redbird-0, 1, 2 (34 x 24)
+REDBIRD = {
+    0: _rows(
+        """
+        ............############..........
+        ............############..........
+        ........##################........
+        ........##################........
+        ......######################......
+        ......######################......
+        ..############################....
+        ..############################....
+        ##############################....
+        ##############################....
+        ##############################....
+        ##############################....
+        ################################..
+        ################################..
+        ..################################
+        ..################################
+        ....############################..
+        ....############################..
+        ....############################..
+        ....############################..
+        ......########################....
+        ......########################....
+        ..........##########..............
+        ..........##########..............
+        """
+    ),
+    1: _rows(
+        """
+        ............############..........
+        ............############..........
+        ........##################........
+        ........##################........
+        ......######################......
+        ......######################......
+        ....##########################....
+        ....##########################....
+        ..############################....
+        ..############################....
+        ..############################....
+        ..############################....
+        ################################..
+        ################################..
+        ##################################
+        ##################################
+        ..##############################..
+        ..##############################..
+        ....############################..
+        ....############################..
+        ......########################....
+        ......########################....
+        ..........##########..............
+        ..........##########..............
+        """
+    ),
+    2: _rows(
+        """
+        ............############..........
+        ............############..........
+        ........##################........
+        ........##################........
+        ......######################......
+        ......######################......
+        ....##########################....
+        ....##########################....
+        ..############################....
+        ..############################....
+        ..############################....
+        ..############################....
+        ..##############################..
+        ..##############################..
+        ##################################
+        ##################################
+        ################################..
+        ################################..
+        ################################..
+        ################################..
+        ..############################....
+        ..############################....
+        ..........##########..............
+        ..........##########..............
+        """
+    ),
+}
+# Bird 가 보여주는 순서 (flappy.animation.SEQUENCES["redbird"])
+REDBIRD_FRAMES = tuple(REDBIRD[number] for number in (0, 1, 2, 1))
+
+# pipe-green (52 x 320): 위쪽 24줄은 입구라서 폭 전체, 나머지 기둥은 양쪽 2픽셀씩 안쪽
+PIPE_LIP_HEIGHT = 24
+PIPE_LIP = (1 << 52) - 1
+PIPE_BODY = PIPE_LIP & ~0b11 & ~(0b11 << 50)
+PIPE = (PIPE_LIP,) * PIPE_LIP_HEIGHT + (PIPE_BODY,) * (320 - PIPE_LIP_HEIGHT)
+
+# 간격별로 만든 파이프 마스크
+_pipes: dict[int, tuple[int, ...]] = {}
+
+
+def pipe_rows(gap) -> tuple[int, ...]:
+    # 위 파이프(뒤집음) + 구멍 + 아래 파이프 (flappy.pipe_pool.make_pipe_prefab 과 같은 모양)
+    gap = int(gap)
+    rows = _pipes.get(gap)
+    if rows is None:
+        rows = _pipes[gap] = PIPE[::-1] + (0,) * gap + PIPE
+    return rows
+
+
+def overlap(obstacle, rows, dx, dy):
+    # 마스크 rows 를 마스크 obstacle 의 (dx, dy) 위치에 놓았을 때 겹치는 픽셀이 있는지 (Mask.overlap 과 같음)
+    start = max(0, -dy)
+    stop = min(len(rows), len(obstacle) - dy)
+    for row in range(start, stop):
+        line = obstacle[dy + row]
+        if (line >> dx if dx >= 0 else line << -dx) & rows[row]:
+            return True
+    return False
+
+
+def _picture(mask):
+    width, height = mask.get_size()
+    return ["".join("#" if mask.get_at((x, y)) else "." for x in range(width)) for y in range(height)]
+
+
+def _mask_rows(mask):
+    return _rows("\n".join(_picture(mask)))
+
+
+if __name__ == "__main__":
+    from flappy.animation import frame_names
+    from flappy.assets import asset_manager
+    from flappy.headless import offscreen_display
+
+    parser = argparse.ArgumentParser(description="pygame 없이 쓰는 충돌 마스크를 만들거나 확인합니다")
+    parser.add_argument("--check", action="store_true", help="게임의 마스크와 같은지 확인")
+    args = parser.parse_args()
+
+    offscreen_display()
+    if args.check:
+        table = asset_manager.frames("redbird")
+        for index, (sprite_name, mask) in enumerate(zip(frame_names("redbird"), table.masks)):
+            if _mask_rows(mask) != REDBIRD_FRAMES[index]:
+                raise AssertionError(f"{sprite_name}: 마스크가 다릅니다 (python -m flappy.hitmask 로 다시 만드세요)")
+        for gap in (80, 100, 125):
+            if _mask_rows(asset_manager.pipe(gap)[1]) != pipe_rows(gap):
+                raise AssertionError(f"pipe gap {gap}: 마스크가 다릅니다")
+        print("hitmask == game masks OK")
+    else:
+        for number in sorted({int(name.rsplit("-", 1)[1]) for name in frame_names("redbird")}):
+            print(f"    {number}: _rows(")
+            print('        """')
+            for line in _picture(asset_manager.mask(f"redbird-{number}")):
+                print(f"        {line}")
+            print('        """')
+            print("    ),")
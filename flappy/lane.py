@@ -0,0 +1,84 @@
+from collections import deque
+
+from pygame.sprite import Group, Sprite
+
+from flappy.collision import Hit, mask_hit
+
+
+class PipeLane(Group):
+    # 파이프만 모아두는 그룹. 파이프는 항상 화면 오른쪽 끝에서 나와서 같은 속도로 왼쪽으로 움직이므로
+    # 나온 순서가 곧 x 순서이다. 그래서 정렬하지 않고 deque 에 순서대로 넣어두기만 하면 된다.
+    #
+    #   생성   : 오른쪽 끝에 추가 (O(1))
+    #   제거   : 맨 왼쪽 파이프가 화면 밖으로 나가면 앞에서 꺼냄 (O(1))
+    #   점수   : 아직 지나가지 않은 첫 번째 파이프만 확인
+    #   충돌   : 왼쪽부터 새 오른쪽 끝을 넘는 파이프가 나올 때까지만 확인
+    #
+    # CollisionGroup 과 같은 query() / begin_frame() / stats() 를 제공한다.
+
+    def __init__(self, *sprites):
+        self.lane: deque[Sprite] = deque()
+        self.passed = 0  # 앞에서부터 새가 이미 지나간 파이프 수
+
+        # 이번 프레임 검사 횟수
+        self.queries = 0
+        self.broad_tests = 0
+        self.narrow_tests = 0
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.lane.append(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        lane = self.lane
+        if lane and lane[0] is sprite:
+            lane.popleft()
+            if self.passed:
+                self.passed -= 1
+            return
+
+        # 재시작 등으로 중간 파이프를 뺄 때만 (드문 경우)
+        index = lane.index(sprite)
+        del lane[index]
+        if index < self.passed:
+            self.passed -= 1
+
+    def begin_frame(self):
+        self.queries = self.broad_tests = self.narrow_tests = 0
+
+    def collect_passed(self, x):
+        # 왼쪽 끝이 x 보다 왼쪽으로 넘어간 파이프를 지나간 것으로 표시하고, 이번에 새로 지나간 개수를 돌려준다
+        lane = self.lane
+        count = 0
+        while self.passed < len(lane) and lane[self.passed].body.x < x:
+            lane[self.passed].passed = True
+            self.passed += 1
+            count += 1
+        return count
+
+    def query(self, sprite) -> Hit | None:
+        self.queries += 1
+        rect = sprite.rect
+        for obstacle in self.lane:
+            if obstacle.rect.left >= rect.right:
+                break  # 이 뒤의 파이프는 모두 더 오른쪽에 있다
+            self.broad_tests += 1
+            if not obstacle.rect.colliderect(rect):
+                continue
+
+            self.narrow_tests += 1
+            hit = mask_hit(obstacle, sprite)
+            if hit is not None:
+                return hit
+        return None
+
+    def stats(self):
+        return {
+            "obstacles": len(self.lane),
+            "passed": self.passed,
+            "queries": self.queries,
+            "broad_tests": self.broad_tests,
+            "narrow_tests": self.narrow_tests,
+        }
@@ -0,0 +1,120 @@
+from contextlib import contextmanager
+from time import perf_counter
+
+from pygame.time import Clock
+
+# 속도, 중력 같은 값들은 모두 60Hz 한 프레임 기준으로 적혀 있고, 업데이트는 dt 를 받아 steps(dt) 만큼 진행한다.
+# 중력은 Body.step(k, ay) 가 등가속도 식으로 정확히 계산하므로 시뮬레이션 주기(tick_rate)를 바꿔도
+# 같은 시각의 위치, 속도는 60Hz 와 같다. 다만 충돌과 점수는 시뮬레이션할 때마다 검사하므로
+# 아슬아슬하게 스치는 경우는 주기에 따라 결과가 다를 수 있어서, 리플레이 파일에 주기를 같이 저장한다.
+REFERENCE_RATE = 60
+
+
+def steps(dt):
+    # dt 초가 60Hz 기준으로 몇 프레임인지 (60Hz 이면 1.0, 120Hz 이면 0.5)
+    return dt * REFERENCE_RATE
+
+
+class GameLoop:
+    # 고정 시간 간격(fixed timestep) 게임 루프
+    #
+    # - 시뮬레이션(update)은 1 / tick_rate 초씩 진행한다.
+    #   프레임이 늦으면 밀린 만큼 여러 번, 빠르면 0번 진행한다 (accumulator 방식).
+    # - 그리기(render)는 프레임마다 한 번, 두 시뮬레이션 상태 사이의 비율 alpha(0~1)와 함께 호출된다.
+    # - max_fps 가 0 이면 그리기 속도를 제한하지 않는다.
+    # - profiler(flappy.profiler.FrameProfiler)를 주면 프레임 단위로 events / sleep 시간을 잰다.
+
+    def __init__(self, tick_rate=REFERENCE_RATE, max_fps=0, max_frame_time=0.25, profiler=None):
+        self.tick_rate = tick_rate
+        self.dt = 1 / tick_rate
+        self.max_fps = max_fps
+        # 한 프레임이 너무 오래 걸려도 (창을 끄는 중 등) 시뮬레이션을 한꺼번에 몰아서 돌리지 않는다
+        self.max_frame_time = max_frame_time
+
+        self.running = False
+        self.ticks = 0  # 지금까지 진행한 시뮬레이션 횟수
+        self.frames = 0  # 지금까지 그린 프레임 수
+
+        self.clock = Clock()
+        self.profiler = profiler
+
+    def stop(self):
+        self.running = False
+
+    def run(self, handle_events, update, render):
+        self.running = True
+        accumulator = 0.0
+        previous = perf_counter()
+
+        profiler = self.profiler
+        while self.running:
+            if profiler is not None:
+                profiler.begin_frame()
+
+            now = perf_counter()
+            accumulator += min(now - previous, self.max_frame_time)
+            previous = now
+
+            if profiler is not None:
+                with profiler.section("events"):
+                    handle_events()
+            else:
+                handle_events()
+
+            while accumulator >= self.dt and self.running:
+                update(self.dt)
+                self.ticks += 1
+                accumulator -= self.dt
+
+            render(accumulator / self.dt)
+            self.frames += 1
+
+            if profiler is not None:
+                with profiler.section("sleep"):
+                    self.clock.tick(self.max_fps)
+                profiler.end_frame()
+            else:
+                self.clock.tick(self.max_fps)
+
+
+class Interpolation:
+    # 직전 시뮬레이션 상태와 현재 상태 사이를 섞어서 그리기 위한 도우미
+    #
+    #   interpolation.snapshot()      # update 직전에 호출
+    #   with interpolation.apply(alpha):
+    #       renderer.render()         # 이 안에서는 rect 가 보간된 위치에 있음
+    #
+    # 한 번에 max_jump 픽셀보다 많이 움직인 스프라이트(화면 끝에서 되돌아간 배경 등)는 보간하지 않는다.
+    # body(flappy.motion.Body)로 움직이는 스프라이트만 실수 위치로 보간해서 소수점 이하 움직임도 살린다.
+    # body 가 없는 스프라이트(점수, 안내 메시지)는 rect 를 바꾸면 그 자리로 바로 옮겨 그린다.
+    # (점수 자릿수가 바뀌어 rect 가 옆으로 옮겨졌을 때 한 프레임 동안 어긋나게 그려지지 않도록)
+    # 그룹 밖에서 따로 그리는 배경(Renderer 의 layers)도 같이 넘기면 함께 보간한다.
+
+    def __init__(self, *groups, max_jump=64):
+        self.groups = groups
+        self.max_jump = max_jump
+        self._previous = {}
+
+    def snapshot(self):
+        self._previous = {
+            sprite: (sprite.body.x, sprite.body.y)
+            for group in self.groups
+            for sprite in group
+            if getattr(sprite, "body", None) is not None
+        }
+
+    @contextmanager
+    def apply(self, alpha):
+        saved = []
+        for sprite, (x0, y0) in self._previous.items():
+            x1, y1 = sprite.body.x, sprite.body.y
+            if abs(x1 - x0) > self.max_jump or abs(y1 - y0) > self.max_jump:
+                continue
+            saved.append((sprite, sprite.rect.topleft))
+            sprite.rect.topleft = (round(x0 + (x1 - x0) * alpha), round(y0 + (y1 - y0) * alpha))
+        try:
+            yield
+        finally:
+            for sprite, position in saved:
+                sprite.rect.topleft = position
+
@@ -0,0 +1,26 @@
+class Body:
+    # 실수(float) 위치와 속도. pygame 의 Rect 는 정수라서 0.4 같은 값이 매 프레임 버려지므로
+    # 움직임은 Body 로 계산하고, rect 는 Body 를 반올림한 값으로만 맞춘다.
+    # 속도 단위는 60Hz 한 프레임에 움직이는 픽셀 수이다 (flappy.loop.steps 참고).
+    __slots__ = ("x", "y", "vx", "vy")
+
+    def __init__(self, x=0.0, y=0.0, vx=0.0, vy=0.0):
+        self.x = float(x)
+        self.y = float(y)
+        self.vx = float(vx)
+        self.vy = float(vy)
+
+    def step(self, k=1.0, ay=0.0):
+        # k 프레임(60Hz 기준) 동안 등가속도 ay 로 움직인다.
+        # 60Hz 한 프레임(속도를 먼저 바꾸고 움직이기: vy += ay; y += vy)을 k 에 대해 정확히 이어붙인 식이라
+        # 0.5 씩 두 번(120Hz) 진행해도 1 씩 한 번(60Hz) 진행한 것과 같은 위치, 같은 속도가 된다.
+        self.x += self.vx * k
+        self.y += self.vy * k + ay * k * (k + 1) / 2
+        self.vy += ay * k
+
+    def sync(self, rect):
+        # rect 의 왼쪽 위를 현재 위치로 맞춘다
+        rect.topleft = (round(self.x), round(self.y))
+
+    def __repr__(self):
+        return f"Body(x={self.x:.2f}, y={self.y:.2f}, vx={self.vx:.2f}, vy={self.vy:.2f})"
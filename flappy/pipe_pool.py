@@ -0,0 +1,66 @@
+import pygame
+from pygame.mask import Mask
+from pygame.surface import Surface
+
+PIPE_SPRITE = "pipe-green"  # 위/아래 파이프 이미지 (위 파이프는 뒤집어서 쓴다)
+
+def make_pipe_prefab(sprites, gap) -> tuple[Surface, Mask]:
+    # 위/아래 파이프를 합친 이미지와 충돌 마스크를 sprites(flappy.sprite_cache.SpriteCache)의 이미지로 만든다.
+    # 모든 파이프가 같이 쓸 이미지는 AssetManager.pipe 로 가져온다 (간격마다 한 번만 만든다)
+    sprite = sprites.get(PIPE_SPRITE)
+    width, height = sprite.get_size()
+
+    pipe_top = pygame.transform.flip(sprite, False, True)
+
+    image = pygame.Surface((width, height * 2 + gap), pygame.SRCALPHA)
+    image.blit(sprite, (0, height + gap))
+    image.blit(pipe_top, (0, 0))
+
+    return sprites.to_display(image), pygame.mask.from_surface(image)
+
+
+class PipePool:
+    # 화면 밖으로 나간 파이프를 버리지 않고 모아두었다가 다음 파이프로 다시 쓴다.
+    # 파이프 클래스에는 reset() 이 있어야 한다 (위치, 점수 여부를 처음 상태로 되돌림).
+
+    def __init__(self, factory, capacity=8):
+        self.factory = factory
+        self.capacity = capacity  # 보관할 수 있는 파이프 최대 개수
+
+        self.created = 0  # 새로 만든 파이프 수
+        self.reused = 0  # 다시 쓴 파이프 수 (= 아낀 생성 횟수)
+        self.dropped = 0  # 풀이 가득 차서 버린 파이프 수
+
+        self._free = []
+
+    def acquire(self, *groups):
+        if self._free:
+            pipe = self._free.pop()
+            pipe.reset()
+            pipe.add(*groups)
+            self.reused += 1
+        else:
+            pipe = self.factory(*groups)
+            pipe.pool = self
+            self.created += 1
+        return pipe
+
+    def release(self, pipe):
+        pipe.kill()
+        if len(self._free) < self.capacity:
+            self._free.append(pipe)
+        else:
+            self.dropped += 1
+
+    @property
+    def allocations_avoided(self):
+        return self.reused
+
+    def stats(self):
+        return {
+            "free": len(self._free),
+            "capacity": self.capacity,
+            "created": self.created,
+            "reused": self.reused,
+            "dropped": self.dropped,
+        }
@@ -0,0 +1,198 @@
+# 프레임마다 각 단계(이벤트, update, 충돌, 그리기, flip, 대기)에 걸린 시간을 재는 도구
+#
+#   profiler = FrameProfiler()
+#   profiler.begin_frame()
+#   with profiler.section("update"):
+#       sprites.update()
+#   profiler.end_frame()
+#
+# 최근 size 프레임만 링 버퍼에 보관하고, CSV / JSON 으로 내보낼 수 있다.
+# 시간 측정은 perf_counter 두 번이라 오버레이를 끄면 비용은 거의 없다.
+# tracer(flappy.trace.Tracer)를 주면 각 단계와 프레임 전체를 trace 파일에도 span 으로 기록한다.
+
+import csv
+import json
+from array import array
+from time import perf_counter
+
+import pygame
+
+from flappy.trace import NULL_TRACER
+
+PHASES = ("events", "update", "collision", "draw", "flip", "sleep")
+
+
+class _Section:
+    # with 문에서 쓰는 타이머. 매번 새로 만들지 않도록 단계마다 하나씩만 만든다.
+    __slots__ = ("times", "index", "start", "name", "tracer")
+
+    def __init__(self, times, index, name, tracer):
+        self.times = times
+        self.index = index
+        self.start = 0.0
+        self.name = name
+        self.tracer = tracer if tracer.enabled else None
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = perf_counter()
+        self.times[self.index] += end - self.start
+        if self.tracer is not None:
+            self.tracer.complete(self.name, self.start, end, "phase")
+
+
+class _NullSection:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NULL_SECTION = _NullSection()
+
+
+class FrameProfiler:
+    def __init__(self, phases=PHASES, size=600, enabled=True, tracer=NULL_TRACER):
+        self.phases = tuple(phases)
+        self.size = size
+        self.enabled = enabled
+        self.tracer = tracer
+
+        # 이번 프레임에 단계별로 누적한 시간 (초)
+        self._current = array("d", [0.0] * len(self.phases))
+        self._sections = {
+            name: _Section(self._current, i, name, tracer) for i, name in enumerate(self.phases)
+        }
+
+        # 링 버퍼: 프레임 전체 시간과 단계별 시간
+        self.frame_times = array("d", [0.0] * size)
+        self.phase_times = [array("d", [0.0] * size) for _ in self.phases]
+        self.count = 0  # 지금까지 기록한 프레임 수
+        self._frame_start = 0.0
+
+    def section(self, name):
+        if not self.enabled:
+            return _NULL_SECTION
+        return self._sections[name]
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        for i in range(len(self._current)):
+            self._current[i] = 0.0
+        self._frame_start = perf_counter()
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        end = perf_counter()
+        slot = self.count % self.size
+        self.frame_times[slot] = end - self._frame_start
+        if self.tracer.enabled:
+            self.tracer.complete("frame", self._frame_start, end, "frame", {"frame": self.count})
+        for times, value in zip(self.phase_times, self._current):
+            times[slot] = value
+        self.count += 1
+
+    def _recent(self, values):
+        # 링 버퍼에서 오래된 것부터 순서대로
+        n = min(self.count, self.size)
+        start = self.count % self.size if self.count > self.size else 0
+        return [values[(start + i) % self.size] for i in range(n)]
+
+    def stats(self):
+        frames = sorted(self._recent(self.frame_times))
+        if not frames:
+            return {"frames": 0}
+        mean = sum(frames) / len(frames)
+        return {
+            "frames": len(frames),
+            "fps": 1 / mean if mean else 0.0,
+            "p50_ms": frames[len(frames) // 2] * 1000,
+            "p99_ms": frames[min(len(frames) - 1, int(len(frames) * 0.99))] * 1000,
+            "phases_ms": {
+                name: sum(times) / len(frames) * 1000
+                for name, times in zip(self.phases, (self._recent(t) for t in self.phase_times))
+            },
+        }
+
+    def rows(self):
+        frames = self._recent(self.frame_times)
+        phases = [self._recent(times) for times in self.phase_times]
+        first = self.count - len(frames)
+        for i, total in enumerate(frames):
+            row = {"frame": first + i, "total_ms": total * 1000}
+            for name, times in zip(self.phases, phases):
+                row[f"{name}_ms"] = times[i] * 1000
+            yield row
+
+    def export(self, path):
+        # 확장자가 .json 이면 JSON, 아니면 CSV 로 저장
+        rows = list(self.rows())
+        if str(path).endswith(".json"):
+            with open(path, "w") as file:
+                json.dump({"phases": self.phases, "stats": self.stats(), "frames": rows}, file)
+            return
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, ["frame", "total_ms"] + [f"{name}_ms" for name in self.phases])
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+class ProfilerOverlay:
+    # 화면 왼쪽 위에 FPS, p50/p99 프레임 시간, 스프라이트 수를 표시한다.
+    # 글자는 refresh 초마다 한 번만 다시 만든다.
+
+    def __init__(self, profiler: FrameProfiler, sprites=None, refresh=0.25, visible=False):
+        self.profiler = profiler
+        self.sprites = sprites
+        self.refresh = refresh
+        self.visible = visible
+
+        self.font = pygame.font.Font(None, 18)
+        self._image = None
+        self._updated = 0.0
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def draw(self, surface):
+        # 그린 영역을 돌려준다 (dirty 렌더링에서 화면에 내보낼 영역)
+        if not self.visible:
+            return None
+
+        now = perf_counter()
+        if self._image is None or now - self._updated >= self.refresh:
+            self._image = self._render()
+            self._updated = now
+        return surface.blit(self._image, (4, 4))
+
+    def _render(self):
+        stats = self.profiler.stats()
+        lines = [
+            f"FPS {stats.get('fps', 0):.0f}",
+            f"p50 {stats.get('p50_ms', 0):.2f} ms  p99 {stats.get('p99_ms', 0):.2f} ms",
+        ]
+        if self.sprites is not None:
+            lines.append(f"sprites {len(self.sprites)}")
+        for name, ms in stats.get("phases_ms", {}).items():
+            lines.append(f"{name:<9} {ms:.2f} ms")
+
+        rendered = [self.font.render(line, True, "white") for line in lines]
+        width = max(text.get_width() for text in rendered) + 8
+        height = sum(text.get_height() for text in rendered) + 8
+
+        # 불투명한 배경을 깔아서 dirty 렌더링에서도 이전 글자가 남지 않게 한다
+        image = pygame.Surface((width, height)).convert()
+        image.fill((0, 0, 0))
+        y = 4
+        for text in rendered:
+            image.blit(text, (4, y))
+            y += text.get_height()
+        return image
@@ -0,0 +1,142 @@
+from collections import deque
+
+import pygame
+from pygame import Rect
+
+
+def union_area(rects, bounds: Rect):
+    # 겹치는 부분은 한 번만 세는 사각형들의 합집합 넓이 (사각형 수가 적으므로 단순하게 계산)
+    rects = [r.clip(bounds) for r in rects]
+    rects = [r for r in rects if r.width and r.height]
+    xs = sorted({x for r in rects for x in (r.left, r.right)})
+    area = 0
+    for left, right in zip(xs, xs[1:]):
+        spans = sorted((r.top, r.bottom) for r in rects if r.left <= left and r.right >= right)
+        covered = 0
+        top = bottom = None
+        for span_top, span_bottom in spans:
+            if bottom is None or span_top > bottom:
+                if bottom is not None:
+                    covered += bottom - top
+                top, bottom = span_top, span_bottom
+            else:
+                bottom = max(bottom, span_bottom)
+        if bottom is not None:
+            covered += bottom - top
+        area += covered * (right - left)
+    return area
+
+
+class Renderer:
+    # 한 프레임을 화면에 그리는 역할
+    #
+    # dirty=False : 매 프레임 화면 전체를 다시 그리고 display.flip()
+    # dirty=True  : 바뀐 부분만 다시 그리고 display.update(rects) 로 그 부분만 내보낸다
+    #
+    # layers 는 스프라이트 그룹 밖에서 따로 그리는 스크롤 배경들이다 (draw(surface) 와 rect 가 있어야 함).
+    # 배경이 움직이면 그 배경이 차지하는 영역(움직이기 전과 후)만 다시 그린다.
+    # 화면 전체를 덮는 배경(하늘)이 움직이면 결국 전체를 다시 그리게 되므로, dirty 모드에서는 그런 배경은 멈춰둔다.
+    # overlays 는 스프라이트 위에 그리는 것들이다 (draw(surface) 가 그린 영역 또는 None 을 돌려줌).
+
+    def __init__(self, screen, sprites, layers=(), overlays=(), dirty=False, history=60):
+        self.screen = screen
+        self.sprites = sprites
+        self.layers = list(layers)
+        self.overlays = list(overlays)
+        self.dirty = dirty
+
+        self.screen_rect = screen.get_rect()
+        self.redraw_ratio = 1.0  # 마지막 프레임에서 다시 그린 화면 비율 (0.0 ~ 1.0)
+        self._ratios = deque(maxlen=history)
+
+        # 스프라이트를 지울 때 쓰는 배경 (layers 를 그려둔 이미지)
+        self._backdrop = pygame.Surface(self.screen_rect.size).convert()
+        self._backdrop_valid = False
+        self._layer_rects = {}
+
+    def render(self):
+        return self.present(self.draw())
+
+    def draw(self):
+        # 화면 Surface 에 그리기만 하고, 화면에 내보낼 영역을 돌려준다
+        if self.dirty:
+            rects = self._render_dirty()
+        else:
+            self._render_full()
+            rects = [self.screen_rect]
+
+        for overlay in self.overlays:
+            rect = overlay.draw(self.screen)
+            if rect is not None and self.dirty:
+                rects.append(rect)
+        return rects
+
+    def present(self, rects):
+        # 그린 내용을 실제 화면(창)으로 내보낸다
+        if self.dirty:
+            pygame.display.update(rects)
+        else:
+            pygame.display.flip()
+
+        self.redraw_ratio = union_area(rects, self.screen_rect) / (
+            self.screen_rect.width * self.screen_rect.height
+        )
+        self._ratios.append(self.redraw_ratio)
+        return rects
+
+    def invalidate(self):
+        # 다음 프레임은 화면 전체를 다시 그린다 (창 크기 변경, 장면 전환 등)
+        self._backdrop_valid = False
+
+    def stats(self):
+        return {
+            "dirty": self.dirty,
+            "redraw_ratio": self.redraw_ratio,
+            "mean_redraw_ratio": sum(self._ratios) / len(self._ratios) if self._ratios else 1.0,
+        }
+
+    def _render_full(self):
+        self.screen.fill(0)
+        for layer in self.layers:
+            layer.draw(self.screen)
+        self.sprites.draw(self.screen)
+
+    def _render_dirty(self):
+        moved = self._moved_area()
+        if not self._backdrop_valid:
+            moved = self.screen_rect
+            self._backdrop_valid = True
+
+        if moved is not None:
+            # 움직인 배경 영역만 배경 이미지를 다시 그린다 (그 영역에 겹치는 다른 배경도 순서대로 같이)
+            self._backdrop.set_clip(moved)
+            self._backdrop.fill(0)
+            for layer in self.layers:
+                layer.draw(self._backdrop)
+            self._backdrop.set_clip(None)
+
+        self.sprites.clear(self.screen, self._backdrop)
+        if moved is None:
+            return list(self.sprites.draw(self.screen))
+
+        # 그 영역을 화면에 옮긴 뒤 스프라이트를 그린다 (draw 는 모든 스프라이트를 다시 그리므로 그 영역의 스프라이트도 그려진다)
+        self.screen.blit(self._backdrop, moved, moved)
+        rects = list(self.sprites.draw(self.screen))
+        rects.append(moved)
+        return rects
+
+    def _moved_area(self):
+        # 지난 프레임 뒤로 움직인 배경들이 차지하는 화면 영역 (움직인 배경이 없으면 None)
+        area = None
+        for layer in self.layers:
+            rect = Rect(layer.rect)
+            previous = self._layer_rects.get(id(layer))
+            self._layer_rects[id(layer)] = rect
+            if previous is not None and previous.topleft == rect.topleft:
+                continue
+
+            changed = rect.clip(self.screen_rect)
+            if previous is not None:
+                changed.union_ip(previous.clip(self.screen_rect))
+            area = changed if area is None else area.union(changed)
+        return area
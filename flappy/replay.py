@@ -0,0 +1,192 @@
+# 리플레이 파일: 게임을 그대로 다시 재생하기 위해 seed 와 space 키를 누른/뗀 프레임만 저장한다.
+# 파이프 위치는 seed 로 정해지고 나머지는 모두 규칙대로 계산되므로 이것만으로 충분하다.
+#
+# 재생은 실제 게임과 같은 코드(flappy.game.Game 의 Bird / Pipe / PipeLane)로 화면 없이 한다.
+# (flappy.sim 도 같은 결과를 내도록 맞춰져 있다. python -m flappy.sim --check 가 이 재생과 비교한다)
+#
+# 파일 구조
+#   헤더   : MAGIC, VERSION, 시뮬레이션 주기(Hz), seed(0 ~ 2**64 - 1), 전체 프레임 수, 이벤트 수
+#            (프레임은 시뮬레이션 횟수라서 기록할 때와 같은 주기로 재생해야 같은 게임이 된다)
+#   이벤트 : (직전 이벤트와의 프레임 차이 << 1 | 누름 여부) 를 varint 로 저장
+#            (보통 한 이벤트에 1~2 바이트)
+#
+#   python -m flappy.replay game.fbr    # 화면 없이 빨리 재생해서 결과 출력
+#   python -m flappy.replay --check     # 기록한 게임과 그 리플레이가 같은 프레임, 같은 점수로 끝나는지 확인
+#   python -m flappy.replay --check --tick-rate 120
+
+import argparse
+import random
+import struct
+from time import perf_counter
+
+from flappy.loop import REFERENCE_RATE
+
+MAGIC = b"FBRP"
+VERSION = 2
+HEADER = struct.Struct("<4sHHQII")  # magic, version, 주기, seed, 프레임 수, 이벤트 수
+SEED_RANGE = 2**64  # 헤더에 부호 없는 8바이트(Q)로 저장할 수 있는 seed 개수
+
+
+def _write_varint(out: bytearray, value):
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class Replay:
+    def __init__(self, seed, events=None, frame_count=0, tick_rate=REFERENCE_RATE):
+        # 게임이 끝나고 저장할 때가 아니라 만들 때 바로 알 수 있게 확인한다
+        if not 0 <= seed < SEED_RANGE:
+            raise ValueError(f"seed 는 0 이상 {SEED_RANGE} 미만이어야 합니다 ({seed})")
+        self.seed = seed
+        # (프레임, 누름 여부) 목록. 프레임은 그 시점까지 진행한 시뮬레이션 횟수
+        self.events: list[tuple[int, bool]] = events if events is not None else []
+        self.frame_count = frame_count
+        self.tick_rate = tick_rate  # 기록할 때의 시뮬레이션 주기 (Hz)
+
+    def record(self, frame, down):
+        # Bird.handle_event 에서 space 키를 누르거나 뗄 때 호출
+        self.events.append((frame, down))
+        self.frame_count = max(self.frame_count, frame)
+
+    def flap_frames(self):
+        return {frame for frame, down in self.events if down}
+
+    def to_bytes(self):
+        out = bytearray(HEADER.pack(MAGIC, VERSION, self.tick_rate, self.seed, self.frame_count, len(self.events)))
+        previous = 0
+        for frame, down in self.events:
+            _write_varint(out, (frame - previous) << 1 | down)
+            previous = frame
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, tick_rate, seed, frame_count, count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("지원하지 않는 리플레이 파일입니다")
+
+        events = []
+        pos = HEADER.size
+        frame = 0
+        for _ in range(count):
+            value, pos = _read_varint(data, pos)
+            frame += value >> 1
+            events.append((frame, bool(value & 1)))
+        return cls(seed, events, frame_count, tick_rate)
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+def play(replay: Replay):
+    # 그리지 않고 게임만 빨리 돌린다. 마지막 상태의 flappy.game.Game 을 돌려준다.
+    # (pygame 이 필요한 게임 코드는 재생할 때만 불러온다. 리플레이 파일 읽기/쓰기는 pygame 없이 된다)
+    import pygame
+    from pygame.sprite import LayeredUpdates
+
+    from flappy.game import Game
+    from flappy.headless import offscreen_display
+
+    offscreen_display()
+    game = Game(LayeredUpdates(), tick_rate=replay.tick_rate)
+    game.start(replay.seed)
+    dt = 1 / replay.tick_rate
+
+    events = replay.events
+    i = 0
+    while game.frame < replay.frame_count and not game.game_over:
+        # 기록한 프레임(그때까지 진행한 시뮬레이션 횟수)이 되면 다음 시뮬레이션 전에 키 입력을 넣는다
+        while i < len(events) and events[i][0] <= game.frame:
+            down = events[i][1]
+            game.handle_event(pygame.event.Event(pygame.KEYDOWN if down else pygame.KEYUP, key=pygame.K_SPACE))
+            i += 1
+        game.step(dt)
+    return game
+
+
+def check_recording(seeds=range(5), frames=20_000, games=3, tick_rate=REFERENCE_RATE):
+    # main2-4-Pipe.py 처럼 Game 하나로 여러 판을 이어서 (reset / start) 기록하고,
+    # 각 리플레이를 파일 형식으로 저장했다가 다시 재생해서 같은 프레임, 같은 점수, 같은 이유로 끝나는지 확인한다
+    import pygame
+    from pygame.sprite import LayeredUpdates
+
+    from flappy.game import Game
+    from flappy.headless import offscreen_display
+    from flappy.settings import SCREEN_HEIGHT
+
+    offscreen_display()
+    game = Game(LayeredUpdates(), tick_rate=tick_rate)
+    dt = 1 / tick_rate
+    keydown = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+    keyup = pygame.event.Event(pygame.KEYUP, key=pygame.K_SPACE)
+
+    results = []
+    for seed in seeds:
+        noise = random.Random(seed)
+        for _ in range(games):
+            game.reset()
+            game.start(noise.randrange(SEED_RANGE))
+            held = False
+            while game.frame < frames and not game.game_over:
+                # 간단한 자동 조종 (flappy.sim.autopilot 과 비슷하게) + 가끔 키를 누른 채로 있기
+                bird = game.bird
+                pipe = next((p for p in game.obstacles.lane if p.rect.right > bird.rect.left), None)
+                target = SCREEN_HEIGHT / 2 if pipe is None else pipe.gap_bottom() - bird.rect.height - 10
+                flap = bird.body.y > target and bird.body.vy >= 0
+                if held and noise.random() < 0.7:
+                    game.handle_event(keyup)
+                    held = False
+                elif flap and not held:
+                    game.handle_event(keydown)
+                    held = True
+                game.step(dt)
+
+            replay = game.replay
+            replay.frame_count = game.frame
+            replayed = play(Replay.from_bytes(replay.to_bytes()))
+            recorded = (game.frame, game.score, game.death_cause)
+            actual = (replayed.frame, replayed.score, replayed.death_cause)
+            if recorded != actual:
+                raise AssertionError(f"seed {replay.seed}: game {recorded} != replay {actual}")
+            results.append(recorded)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="리플레이 파일을 화면 없이 재생합니다")
+    parser.add_argument("path", nargs="?")
+    parser.add_argument("--check", action="store_true", help="기록한 게임과 리플레이 결과가 같은지 확인")
+    parser.add_argument("--tick-rate", type=int, default=REFERENCE_RATE, help="--check 로 기록할 시뮬레이션 주기 (Hz)")
+    args = parser.parse_args()
+
+    if args.check:
+        results = check_recording(tick_rate=args.tick_rate)
+        print(f"{len(results)} games: game == replay OK (frames, score: {[result[:2] for result in results]})")
+    if args.path:
+        replay = Replay.load(args.path)
+        start = perf_counter()
+        game = play(replay)
+        elapsed = perf_counter() - start
+
+        print(f"seed {replay.seed}, {len(replay.events)} events, {replay.frame_count} frames at {replay.tick_rate} Hz")
+        print(f"score {game.score}, survived {game.frame} frames, death cause {game.death_cause}")
+        print(f"{game.frame / elapsed:,.0f} frames/s")
@@ -0,0 +1,123 @@
+import heapq
+import itertools
+
+# 시간이 정확히 같은 값이 되지 않아도 (1/60 을 90번 더하면 1.4999...) 그 시각으로 본다
+EPSILON = 1e-9
+
+
+class Timer:
+    __slots__ = ("due", "interval", "callback", "tag", "paused", "remaining", "cancelled", "version")
+
+    def __init__(self, due, interval, callback, tag):
+        self.due = due  # 다음에 실행할 시각 (시뮬레이션 시간, 초)
+        self.interval = interval  # 반복 간격 (None 이면 한 번만 실행)
+        self.callback = callback
+        self.tag = tag
+        self.paused = False
+        self.remaining = 0.0  # 멈췄을 때 남아있던 시간
+        self.cancelled = False
+        self.version = 0  # 큐에 다시 넣을 때마다 증가 (예전 항목을 구분하기 위함)
+
+
+class Scheduler:
+    # 시뮬레이션 시간에 묶인 타이머 모음 (파이프 생성, 난이도 변화, UI 타이머 등)
+    #
+    # pygame.time.set_timer 와 달리 벽시계가 아니라 advance(dt) 로 진행한 시간만큼만 흐른다.
+    # 그래서 프레임이 밀려도 이벤트가 몰려서 나오지 않고, 빨리 감기나 화면 없는 실행에서도 간격이 같다.
+    #
+    #   scheduler.every(1.5, spawn_pipe, tag="spawn")
+    #   scheduler.pause("spawn")     # 게임 오버
+    #   scheduler.resume("spawn")    # 멈춘 곳부터 이어서
+    #   scheduler.restart("spawn")   # 처음부터 다시 세기 (게임 재시작)
+    #   scheduler.time_scale = 0.5   # 타이머만 절반 속도로
+
+    def __init__(self):
+        self.time = 0.0
+        self.time_scale = 1.0
+        self.paused = False
+
+        self._queue: list[tuple[float, int, int, Timer]] = []
+        self._counter = itertools.count()  # 같은 시각이면 먼저 등록한 순서대로
+        self._timers: set[Timer] = set()
+
+    def after(self, delay, callback, tag=None) -> Timer:
+        return self._add(Timer(self.time + delay, None, callback, tag))
+
+    def every(self, interval, callback, tag=None, delay=None) -> Timer:
+        # delay 를 주지 않으면 interval 뒤에 처음 실행
+        first = interval if delay is None else delay
+        return self._add(Timer(self.time + first, interval, callback, tag))
+
+    def cancel(self, target):
+        for timer in self._select(target):
+            timer.cancelled = True
+            self._timers.discard(timer)
+
+    def pause(self, target=None):
+        # target: Timer, tag 문자열, None(전체)
+        if target is None:
+            self.paused = True
+            return
+        for timer in self._select(target):
+            if not timer.paused:
+                timer.paused = True
+                timer.remaining = timer.due - self.time
+
+    def resume(self, target=None):
+        if target is None:
+            self.paused = False
+            return
+        for timer in self._select(target):
+            if timer.paused:
+                timer.paused = False
+                timer.due = self.time + timer.remaining
+                self._push(timer)
+
+    def restart(self, target, delay=None):
+        # 타이머를 지금부터 다시 센다 (멈춰 있었다면 다시 시작). delay 를 주지 않으면 interval 뒤에 실행
+        for timer in self._select(target):
+            timer.paused = False
+            timer.due = self.time + (timer.interval if delay is None else delay)
+            self._push(timer)
+
+    def clear(self):
+        self._queue.clear()
+        self._timers.clear()
+        self.time = 0.0
+
+    def advance(self, dt):
+        # 시뮬레이션 한 번(dt 초)마다 호출. 시간이 된 타이머의 callback 을 실행한다.
+        if self.paused:
+            return
+        self.time += dt * self.time_scale
+
+        queue = self._queue
+        while queue and queue[0][0] <= self.time + EPSILON:
+            _, _, version, timer = heapq.heappop(queue)
+            # 멈췄거나 취소됐거나, resume 으로 다시 넣기 전의 예전 항목은 건너뛴다
+            if timer.cancelled or timer.paused or version != timer.version:
+                continue
+
+            if timer.interval is None:
+                self._timers.discard(timer)
+            else:
+                timer.due += timer.interval
+                self._push(timer)
+            timer.callback()
+
+    def __len__(self):
+        return len(self._timers)
+
+    def _add(self, timer):
+        self._timers.add(timer)
+        self._push(timer)
+        return timer
+
+    def _push(self, timer):
+        timer.version += 1
+        heapq.heappush(self._queue, (timer.due, next(self._counter), timer.version, timer))
+
+    def _select(self, target):
+        if isinstance(target, Timer):
+            return [target] if target in self._timers else []
+        return [timer for timer in self._timers if timer.tag == target]
@@ -0,0 +1,13 @@
+from pathlib import Path
+
+TITLE = "Flappy Bird"
+SCREEN_WIDTH = 288
+SCREEN_HEIGHT = 512
+FPS = 60
+TICK_RATE = 120  # 시뮬레이션 주기 (Hz). 그리기 속도(FPS)와 따로 정한다
+
+PROJ_DIR = Path(__file__).parent.parent
+ASSETS_DIR = PROJ_DIR / "assets"
+SPRITES_DIR = ASSETS_DIR / "sprites"
+AUDIOS_DIR = ASSETS_DIR / "audios"
+ICON_DIR = ASSETS_DIR / "icons"
@@ -0,0 +1,261 @@
+# 창 없이 돌아가는 Flappy Bird 시뮬레이션
+# pygame 을 import 하지 않으므로 테스트나 CI 에서 게임 규칙만 빠르게 돌릴 수 있다.
+# 움직임, 날갯짓 애니메이션, 파이프 생성/위치는 flappy/sprites.py 의 Bird / Pipe / ScrollLayer 와 같고,
+# 충돌(새의 프레임별 마스크와 파이프 마스크, flappy.hitmask)과 계산 순서(충돌 검사 다음 점수)는
+# flappy/game.py 의 Game.step 과 같다. 그래서 같은 seed, 같은 입력이면 게임과 같은 프레임에 같은 점수로 끝난다.
+# (flappy.batch, flappy.sweep 도 이 규칙을 그대로 쓴다)
+#
+#   sim = Simulation(seed=1)
+#   while not sim.game_over:
+#       sim.step(flap=autopilot(sim))   # flap=True 는 그 프레임에 space 를 눌렀다가 바로 뗀 것
+#   print(sim.score, sim.frame, sim.death_cause)
+#
+#   python -m flappy.sim --check        # 같은 입력으로 게임(flappy.replay.play)과 결과가 같은지 확인
+
+import argparse
+import math
+import random
+from dataclasses import dataclass
+from time import perf_counter
+
+from flappy.flap import FlapCursor, FlapTiming
+from flappy.hitmask import REDBIRD_FRAMES, overlap, pipe_rows
+from flappy.motion import Body
+from flappy.settings import SCREEN_HEIGHT, SCREEN_WIDTH
+
+# assets/sprites 이미지 크기 (pygame 없이 쓰기 위해 숫자로 적어둠)
+BIRD_WIDTH, BIRD_HEIGHT = 34, 24  # redbird-*.png
+PIPE_WIDTH, PIPE_HEIGHT = 52, 320  # pipe-green.png
+FLOOR_HEIGHT = 112  # floor.png
+
+
+@dataclass(frozen=True)
+class Rules:
+    # 모든 값은 60Hz 한 프레임 기준
+    gravity: float = 0.4  # Bird.GRAVITY
+    flap_strength: float = 6  # Bird.FLAP_STRENGTH
+    bird_x: float = 50  # 새가 날아와서 멈추는 x 위치
+    bird_start: tuple[float, float] = (-50, 50)
+    bird_enter_speed: float = 3  # 시작 위치로 날아오는 속도
+
+    gap: float = 100  # Pipe.gap
+    pipe_speed: float = 2  # 파이프가 왼쪽으로 움직이는 속도
+    pipe_margin: float = 100  # 파이프 구멍 중심이 위/아래 끝에서 떨어지는 최소 거리
+    spawn_interval: int = 90  # 파이프 생성 간격 (프레임, 1500ms)
+
+    background_speed: float = 1  # 하늘 (파이프, 바닥보다 느리게 움직여서 멀리 있는 것처럼 보인다)
+
+    floor_y: float = SCREEN_HEIGHT - FLOOR_HEIGHT  # 바닥 윗면. 새의 아래쪽 끝이 여기 닿으면 게임 오버
+
+
+DEFAULT_RULES = Rules()
+
+
+def pipe_top(center_y, gap):
+    # 위/아래 파이프를 합친 전체 높이의 위쪽 y (Pipe.reset 의 rect.midleft 와 같은 정수 값)
+    # pygame 의 Rect 는 소수를 0.5 에서 올림한다 (중심 y 는 항상 양수)
+    return math.floor(center_y + 0.5) - (PIPE_HEIGHT * 2 + int(gap)) // 2
+
+
+class SimPipe:
+    __slots__ = ("body", "gap", "passed")
+
+    def __init__(self, x, center_y, rules: Rules):
+        # 위/아래 파이프를 합친 전체 높이의 왼쪽 위 좌표 (Pipe.rect 와 같음)
+        self.body = Body(x, pipe_top(center_y, rules.gap), vx=-rules.pipe_speed)
+        self.gap = rules.gap
+        self.passed = False
+
+    def gap_top(self):
+        return self.body.y + PIPE_HEIGHT
+
+    def gap_bottom(self):
+        return self.body.y + PIPE_HEIGHT + self.gap
+
+
+class Simulation:
+    def __init__(self, seed=None, rules: Rules = DEFAULT_RULES):
+        self.rules = rules
+        self.seed = seed
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        # 9.엔터누르면재시작 처럼 같은 객체를 처음 상태로 되돌린다
+        if seed is not None:
+            self.seed = seed
+        self.rng = random.Random(self.seed)
+
+        self.bird = Body(*self.rules.bird_start)
+        # 날갯짓 애니메이션 (Bird 와 같은 FlapTiming 기본값). 프레임마다 충돌 마스크가 달라진다
+        self.cursor = FlapCursor(len(REDBIRD_FRAMES), FlapTiming())
+        self.bird_frame = 0
+        self.pipes: list[SimPipe] = []
+        self.background_x = 0.0
+
+        self.frame = 0
+        self.score = 0
+        self.game_over = False
+        self.death_cause = None  # "pipe", "ceiling", "floor"
+
+    def flap(self):
+        # Bird.handle_event 에 space 를 누른 이벤트와 뗀 이벤트가 같이 들어온 것과 같다
+        self.bird.vy = -self.rules.flap_strength
+        self.cursor.release()
+
+    def spawn_pipe(self):
+        rules = self.rules
+        min_y = rules.pipe_margin
+        max_y = SCREEN_HEIGHT - FLOOR_HEIGHT - rules.pipe_margin
+        pipe = SimPipe(SCREEN_WIDTH, self.rng.uniform(min_y, max_y), rules)
+        self.pipes.append(pipe)
+        return pipe
+
+    def step(self, flap=False):
+        # 한 프레임 진행. 이번 프레임에 통과한 파이프 수를 돌려준다.
+        if self.game_over:
+            return 0
+        rules = self.rules
+        self.frame += 1
+
+        if flap:
+            self.flap()
+
+        # 파이프 생성 (main2-4-Pipe.py 의 PIPE_SPAWN_EVENT 와 같은 간격)
+        if self.frame % rules.spawn_interval == 0:
+            self.spawn_pipe()
+
+        # Bird.update
+        self.bird_frame = self.cursor.advance(1)
+        bird = self.bird
+        bird.vx = rules.bird_enter_speed if bird.x < rules.bird_x else 0
+        bird.step(ay=rules.gravity)
+        bird.x = min(bird.x, rules.bird_x)
+
+        # ScrollLayer.update (하늘)
+        self.background_x -= rules.background_speed
+        if self.background_x <= -SCREEN_WIDTH:
+            self.background_x += SCREEN_WIDTH
+
+        # Pipe.update: 화면 왼쪽 밖으로 나간 파이프는 앞에서부터 제거
+        for pipe in self.pipes:
+            pipe.body.step()
+        while self.pipes and self.pipes[0].body.x + PIPE_WIDTH <= 0:
+            self.pipes.pop(0)
+
+        # 충돌을 먼저 검사한다 (파이프를 지나가는 프레임에 죽으면 점수를 얻지 못함)
+        cause = self.check_collision()
+        if cause is not None:
+            self.game_over = True
+            self.death_cause = cause
+            return 0
+
+        # 점수 (PipeLane.collect_passed)
+        passed = 0
+        for pipe in self.pipes:
+            if not pipe.passed and pipe.body.x < rules.bird_x:
+                pipe.passed = True
+                passed += 1
+        self.score += passed
+        return passed
+
+    def check_collision(self):
+        # Bird.check_collision, Game._death_cause 와 같은 순서로 rect(반올림한 위치)와 마스크로 검사한다
+        bird = self.bird
+        left, top = round(bird.x), round(bird.y)
+
+        # PipeLane.query: x 가 겹치는 파이프만 새의 지금 프레임 마스크로 검사
+        rows = REDBIRD_FRAMES[self.bird_frame]
+        obstacle = pipe_rows(self.rules.gap)
+        gap = int(self.rules.gap)
+        for pipe in self.pipes:
+            x, y = round(pipe.body.x), round(pipe.body.y)
+            if x >= left + BIRD_WIDTH:
+                break
+            if x + PIPE_WIDTH <= left:
+                continue
+            # 새 전체가 구멍 안에 있으면 마스크를 볼 필요가 없다
+            if y + PIPE_HEIGHT <= top and top + BIRD_HEIGHT <= y + PIPE_HEIGHT + gap:
+                continue
+            if overlap(obstacle, rows, left - x, top - y):
+                return "pipe"
+
+        if top + BIRD_HEIGHT < 0:
+            return "ceiling"
+        if top + BIRD_HEIGHT >= self.rules.floor_y:
+            return "floor"
+        return None
+
+    def next_pipe(self):
+        # 아직 새를 지나가지 않은 가장 앞의 파이프
+        for pipe in self.pipes:
+            if pipe.body.x + PIPE_WIDTH > self.bird.x:
+                return pipe
+        return None
+
+
+def autopilot(sim: Simulation):
+    # 간단한 자동 조종: 다음 파이프 구멍 아래쪽에 가까워지면 날갯짓
+    pipe = sim.next_pipe()
+    if pipe is None:
+        target = SCREEN_HEIGHT / 2
+    else:
+        target = pipe.gap_bottom() - BIRD_HEIGHT - 10
+    return sim.bird.y > target and sim.bird.vy >= 0
+
+
+def run_episode(seed, rules: Rules = DEFAULT_RULES, policy=autopilot, max_frames=10_000):
+    sim = Simulation(seed, rules)
+    while not sim.game_over and sim.frame < max_frames:
+        sim.step(flap=policy(sim))
+    return sim
+
+
+def check_against_game(seeds=range(40), max_frames=10_000):
+    # 자동 조종한 날갯짓을 리플레이로 만들어 실제 게임 코드(flappy.replay.play)로 재생하고
+    # 같은 프레임, 같은 점수, 같은 이유로 끝나는지 확인한다 (게임 코드는 여기서만 불러온다)
+    from flappy.replay import Replay, play
+
+    results = []
+    for seed in seeds:
+        sim = Simulation(seed)
+        replay = Replay(seed)
+        while not sim.game_over and sim.frame < max_frames:
+            flap = autopilot(sim)
+            if flap:
+                # 그때까지 진행한 프레임에 누르고 바로 뗀다
+                replay.record(sim.frame, True)
+                replay.record(sim.frame, False)
+            sim.step(flap=flap)
+        replay.frame_count = sim.frame
+
+        game = play(replay)
+        expected = (sim.frame, sim.score, sim.death_cause)
+        actual = (game.frame, game.score, game.death_cause if game.game_over else None)
+        if expected != actual:
+            raise AssertionError(f"seed {seed}: sim {expected} != game {actual}")
+        results.append(expected)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="창 없이 게임을 여러 번 돌려서 속도를 잽니다")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-frames", type=int, default=10_000)
+    parser.add_argument("--check", action="store_true", help="게임(flappy.replay.play)과 결과가 같은지 먼저 확인")
+    args = parser.parse_args()
+
+    if args.check:
+        results = check_against_game(range(args.seed, args.seed + 40), args.max_frames)
+        print(f"{len(results)} games: sim == game OK (mean score {sum(score for _, score, _ in results) / len(results):.2f})")
+
+    start = perf_counter()
+    frames = score = 0
+    for i in range(args.games):
+        sim = run_episode(args.seed + i, max_frames=args.max_frames)
+        frames += sim.frame
+        score += sim.score
+    elapsed = perf_counter() - start
+
+    print(f"{args.games} games, {frames} frames in {elapsed:.2f}s")
+    print(f"{args.games / elapsed:.0f} games/s, {frames / elapsed:.0f} frames/s, mean score {score / args.games:.2f}")
@@ -0,0 +1,184 @@
+from collections import OrderedDict
+from pathlib import Path
+
+import pygame
+from pygame.surface import Surface
+
+from flappy.settings import SPRITES_DIR
+
+
+def is_opaque(surface: Surface):
+    # 투명한 픽셀이 하나도 없는지 (알파가 모두 255 이고 colorkey 색 픽셀도 없음)
+    width, height = surface.get_size()
+    return pygame.mask.from_surface(surface, 254).count() == width * height
+
+
+# 투명한 부분을 나타낼 색 후보 (이미지에 쓰이지 않은 색을 고른다)
+_COLORKEYS = [(255, 0, 255), (0, 255, 0), (1, 2, 3), (254, 1, 253)]
+
+
+def _colorkey_for(surface: Surface):
+    # 알파가 0 또는 255 뿐인 이미지라면 투명한 부분에 칠할, 이미지에 쓰이지 않은 색을 돌려준다 (아니면 None)
+    visible = pygame.mask.from_surface(surface, 0)
+    if visible.count() != pygame.mask.from_surface(surface, 254).count():
+        return None  # 반투명한 픽셀이 있다
+    for color in _COLORKEYS:
+        if not pygame.mask.from_threshold(surface, color).overlap_area(visible, (0, 0)):
+            return color
+    return None
+
+
+def display_format(surface: Surface) -> Surface:
+    # 화면과 같은 픽셀 포맷으로 바꿔서 blit 할 때마다 포맷 변환을 하지 않게 한다.
+    # 불투명한 이미지(배경 등)는 알파 채널 없이 convert(), 반투명한 픽셀이 있으면 convert_alpha().
+    # 완전히 투명하거나 불투명한 픽셀만 있는 이미지(새, 파이프, 숫자)는 투명한 부분을 colorkey 로 바꾸고
+    # RLE 로 압축해두면 투명한 부분을 건너뛰므로 가장 빠르다.
+    # set_mode 로 화면을 만든 뒤에만 호출할 수 있다.
+    if is_opaque(surface):
+        surface = surface.convert()
+        surface.set_colorkey(None)
+        return surface
+
+    # 팔레트 PNG 는 같은 색이 투명/불투명 두 번 들어있을 수 있어서 먼저 픽셀별 알파로 바꾼다
+    surface = surface.convert_alpha()
+    colorkey = _colorkey_for(surface)
+    if colorkey is None:
+        return surface
+
+    keyed = pygame.Surface(surface.get_size())
+    keyed.fill(colorkey)
+    keyed.blit(surface, (0, 0))
+    keyed = keyed.convert()
+    keyed.set_colorkey(colorkey, pygame.RLEACCEL)
+    return keyed
+
+
+class SpriteCache:
+    # 스프라이트 이미지를 한 번만 디스크에서 읽고, 그 다음부터는 같은 Surface를 돌려준다.
+    # 돌려받은 Surface는 여러 곳에서 같이 쓰므로 직접 그림을 그리면 안 된다 (복사해서 사용).
+    # set_mode 전에 읽은 이미지를 화면 포맷으로 바꾸는 것은 이 캐시에서만 한다.
+    # 스프라이트로 만드는 이미지(프레임 표, 파이프 등)는 만들 때 쓴 이미지의 version 이 바뀌면 다시 만든다
+    # (AssetManager.derived).
+
+    def __init__(self, directory=SPRITES_DIR, max_size=None):
+        self.directory = Path(directory)
+        self.max_size = max_size  # None 이면 개수 제한 없음
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # 가장 최근에 사용한 이미지가 맨 뒤에 오도록 유지 (LRU)
+        self._surfaces: OrderedDict[str, Surface] = OrderedDict()
+        # 화면 포맷으로 변환(convert_alpha)이 끝난 이미지 이름
+        self._converted: set[str] = set()
+        # 이름별로 이미지가 바뀐 횟수 (디스크에서 읽음, 변환, put)
+        self._versions: dict[str, int] = {}
+
+    def get(self, name) -> Surface:
+        surface = self._surfaces.get(name)
+        if surface is None:
+            self.misses += 1
+            surface = pygame.image.load(self.directory / f"{name}.png")
+            self._surfaces[name] = surface
+            self._bump(name)
+            self._evict()
+        else:
+            self.hits += 1
+            self._surfaces.move_to_end(name)
+
+        # set_mode 전에 읽은 이미지는 화면이 만들어진 뒤 처음 쓸 때 변환한다
+        if name not in self._converted and self.display_ready():
+            surface = self._convert(name, surface)
+        return surface
+
+    def put(self, name, surface):
+        # 다른 곳(예: 텍스처 아틀라스)에서 만든 Surface를 캐시에 넣는다
+        self._surfaces[name] = surface
+        self._surfaces.move_to_end(name)
+        self._converted.discard(name)
+        self._bump(name)
+        self._evict()
+
+    def preload(self):
+        # assets/sprites 안의 모든 이미지를 미리 읽어둔다 (게임 시작 전에 한 번)
+        for file in sorted(self.directory.glob("*.png")):
+            self.get(file.stem)
+        return self.surfaces()
+
+    def surfaces(self):
+        return dict(self._surfaces)
+
+    def convert_all(self):
+        # set_mode 이후에 호출하면 이미 읽어둔 이미지를 모두 화면 포맷으로 바꾼다
+        if not self.display_ready():
+            return
+        for name, surface in list(self._surfaces.items()):
+            if name not in self._converted:
+                self._convert(name, surface)
+
+    def clear(self):
+        self._surfaces.clear()
+        self._converted.clear()
+
+    @staticmethod
+    def display_ready():
+        # set_mode 로 화면을 만든 뒤인지 (그 전에는 화면 포맷으로 바꿀 수 없다)
+        return pygame.display.get_surface() is not None
+
+    def version(self, name):
+        # name 이미지가 바뀐 횟수. 이 값이 같으면 get(name) 이 같은 Surface 를 돌려준다.
+        # set_mode 전에 읽어둔 이미지는 여기서 변환하므로, 화면이 만들어진 뒤에는 변환한 이미지의 version 이다.
+        surface = self._surfaces.get(name)
+        if surface is not None and name not in self._converted and self.display_ready():
+            self._convert(name, surface)
+        return self._versions.get(name, 0)
+
+    def to_display(self, surface) -> Surface:
+        # 스프라이트로 새로 만든 이미지도 스프라이트와 같은 때에 화면 포맷으로 바꾼다
+        return display_format(surface) if self.display_ready() else surface
+
+    def stats(self):
+        return {
+            "size": len(self._surfaces),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __contains__(self, name):
+        return name in self._surfaces
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def _convert(self, name, surface) -> Surface:
+        surface = display_format(surface)
+        self._surfaces[name] = surface
+        self._converted.add(name)
+        self._bump(name)
+        return surface
+
+    def _bump(self, name):
+        self._versions[name] = self._versions.get(name, 0) + 1
+
+    def _evict(self):
+        if self.max_size is None:
+            return
+        while len(self._surfaces) > self.max_size:
+            name, _ = self._surfaces.popitem(last=False)
+            self._converted.discard(name)
+            self.evictions += 1
+
+
+# 게임 전체에서 하나만 사용하는 캐시
+sprite_cache = SpriteCache()
+
+
+def get_sprite(name) -> Surface:
+    return sprite_cache.get(name)
+
+
+def load_sprites():
+    return sprite_cache.preload()
@@ -0,0 +1,263 @@
+# 게임에 나오는 스프라이트들 (새, 흘러가는 배경, 파이프, 안내 메시지, 점수)
+# main2-4-Pipe.py 와 벤치마크(benchmarks/)에서 같이 쓴다.
+# 스프라이트를 만들기 전에 pygame.display.set_mode() 로 창을 먼저 열어야 한다.
+
+import random
+from collections import OrderedDict
+from enum import IntEnum, auto
+
+import pygame
+from pygame import Rect
+from pygame.sprite import Sprite
+
+from flappy.assets import asset_manager
+from flappy.flap import FlapCursor, FlapTiming
+from flappy.loop import steps
+from flappy.motion import Body
+from flappy.settings import SCREEN_HEIGHT, SCREEN_WIDTH
+from flappy.sim import DEFAULT_RULES as RULES
+from flappy.sprite_cache import display_format, get_sprite
+
+
+class Layer(IntEnum):
+    BACKGROUND = auto()
+    OBSTACLE = auto()
+    FLOOR = auto()
+    PLAYER = auto()
+    UI = auto()
+
+
+class Bird(Sprite):
+    # 게임 규칙 값은 창 없이 돌아가는 시뮬레이션(flappy.sim)과 같이 쓴다
+    GRAVITY = RULES.gravity  # 중력 (프레임마다 증가하는 떨어지는 속도)
+    FLAP_STRENGTH = RULES.flap_strength  # 날갯짓 강도
+    ANIMATION_SPEED = 0  # 기본 애니메이션 속도 (0 이면 날갯짓하지 않을 때 날개를 접고 있음)
+    FLAP_ANIMATION_SPEED = 0.2  # 날갯짓 애니메이션 속도 (더 빠름)
+    FLAP_DURATION = 15  # space를 뗀 후 몇 프레임 동안 애니메이션이 계속될지 설정
+
+    def __init__(self, *groups):
+        self._layer = Layer.PLAYER  # 새는 위쪽 레이어에 그리기 위해 레이어를 1로 설정
+
+        # 날갯짓 이미지와 마스크는 모든 새가 같이 쓰고, 새마다 몇 번째 프레임인지(cursor)만 갖는다
+        self.frames = asset_manager.frames("redbird")
+        self.cursor = FlapCursor(
+            len(self.frames), FlapTiming(self.ANIMATION_SPEED, self.FLAP_ANIMATION_SPEED, self.FLAP_DURATION)
+        )
+
+        # 실제 위치와 떨어지는 속도(vy)는 body 에 실수로 저장하고 rect 는 그 값을 반올림해서 맞춘다
+        self.body = Body()
+        self.rect: Rect = self.frames.frames[0].get_rect()
+
+        self.reset()
+
+        super().__init__(*groups)
+
+    def reset(self):
+        # 처음 상태로 되돌린다 (다시 시작할 때 새로 만들지 않고 이 함수를 호출)
+        # 기본 이미지는 첫번째 이미지로 설정
+        self.cursor.reset()
+        self.image, self.mask = self.frames.frame(0)
+
+        # 이미지의 위치는 (-50, 50)으로 설정
+        self.body.x, self.body.y = RULES.bird_start
+        self.body.vx = self.body.vy = 0.0
+        self.body.sync(self.rect)
+
+        # space 키가 눌렸는지 여부
+        self.flapping = False
+
+        # 마지막으로 부딪힌 파이프와 위치 (collision.Hit)
+        self.hit = None
+
+    def update(self, dt):
+        # 60Hz 기준으로 몇 프레임만큼 진행하는지 (120Hz 이면 0.5)
+        k = steps(dt)
+
+        # 날갯짓 상태에 따른 애니메이션 처리 (날갯짓하지 않을 때는 0번째 이미지)
+        # 프레임이 바뀌면 충돌 마스크도 그 프레임의 마스크로 바꾼다
+        self.image, self.mask = self.frames.frame(self.cursor.advance(k, self.flapping))
+
+        # 새가 시작 위치로 이동하는 코드
+        self.body.vx = RULES.bird_enter_speed if self.body.x < RULES.bird_x else 0
+
+        # 중력 및 위치 업데이트. 시작 위치를 지나치지 않게 멈춰서 주기에 따라 멈추는 위치가 달라지지 않게 한다
+        self.body.step(k, ay=self.GRAVITY)
+        self.body.x = min(self.body.x, RULES.bird_x)
+        # 바닥에 닿으면 바닥 위에 멈춘다 (게임 오버 뒤에 바닥을 뚫고 떨어지는 것처럼 보이지 않게)
+        if self.body.y + self.rect.height > RULES.floor_y:
+            self.body.y = RULES.floor_y - self.rect.height
+            self.body.vy = 0.0
+        self.body.sync(self.rect)
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+            self.flapping = True
+            self.body.vy = -self.FLAP_STRENGTH
+
+        if event.type == pygame.KEYUP and event.key == pygame.K_SPACE:
+            self.flapping = False
+            self.cursor.release()  # space 키를 뗀 후에도 FLAP_DURATION 동안 애니메이션 유지
+
+
+    def check_collision(self, obstacles):
+        # 근처에 있는 파이프만 마스크로 검사한다 (배경, UI 등은 검사하지 않음)
+        self.hit = obstacles.query(self)
+        # 화면 위로 완전히 나가거나 바닥에 닿아도 게임 오버 (flappy.sim 과 같은 규칙)
+        return self.hit is not None or self.rect.bottom < 0 or self.rect.bottom >= RULES.floor_y
+
+
+class ScrollLayer(Sprite):
+    # 왼쪽으로 계속 흘러가는 배경 한 줄 (하늘, 바닥)
+    #
+    # 이미지를 가로로 이어붙인 띠(strip)를 처음에 한 번만 만들고, 띠 전체를 rect 위치에 놓는다.
+    # 화면 밖으로 나간 부분은 그려지지 않으므로 프레임마다 화면에 보이는 만큼만 한 번 blit 한다.
+    # 스프라이트 그룹에 넣어서 그려도 되고, Renderer 의 layers 로 넘겨서 draw() 로 그려도 된다.
+
+    def __init__(self, image, speed, y=0, layer=Layer.BACKGROUND, *groups):
+        self._layer = layer
+        self.speed = speed  # 스크롤 속도 (60Hz 한 프레임에 움직이는 픽셀, 소수도 가능)
+        self.tile_width = image.get_width()
+
+        # 화면을 다 덮고도 한 장이 더 남도록 이어붙인다 (한 장 너비만큼 움직이면 처음 위치로 되돌림)
+        tiles = -(-SCREEN_WIDTH // self.tile_width) + 1
+        strip = pygame.Surface((self.tile_width * tiles, image.get_height()), pygame.SRCALPHA)
+        for i in range(tiles):
+            strip.blit(image, (self.tile_width * i, 0))
+        self.image = display_format(strip)
+
+        self.rect = self.image.get_rect(topleft=(0, y))
+        self.body = Body(0, y, vx=-speed)
+
+        super().__init__(*groups)
+
+    def update(self, dt):
+        self.body.vx = -self.speed
+        self.body.step(steps(dt))
+
+        # 한 장 너비만큼 움직였으면 오른쪽으로 되돌림 (띠가 같은 그림의 반복이라 티가 나지 않는다)
+        if self.body.x <= -self.tile_width:
+            self.body.x += self.tile_width
+        self.body.sync(self.rect)
+
+    def draw(self, surface):
+        # 띠에서 화면에 보이는 부분만 잘라서 한 번에 그린다
+        area = Rect(-self.rect.x, 0, SCREEN_WIDTH, self.rect.height)
+        return surface.blit(self.image, (0, self.rect.y), area)
+
+
+class Pipe(Sprite):
+    SPEED = RULES.pipe_speed  # 왼쪽으로 움직이는 속도 (소수도 가능)
+
+    def __init__(self, *groups, rng=random):
+        self._layer = Layer.OBSTACLE
+        self.gap = RULES.gap
+
+        # 파이프 높이를 정하는 난수 생성기 (게임마다 seed 가 정해진 random.Random 을 넘겨준다)
+        self.rng = rng
+
+        # 위/아래 파이프를 합친 이미지와 마스크는 간격마다 한 번만 만들어서 같이 쓴다
+        self.image, self.mask = asset_manager.pipe(self.gap)
+        self.rect = self.image.get_rect()
+        self.body = Body(vx=-self.SPEED)
+
+        # 파이프 풀에서 만든 경우 화면 밖으로 나가면 풀로 돌려보낸다
+        self.pool = None
+
+        self.reset()
+
+        super().__init__(*groups)
+
+    def reset(self):
+        sprite_floor_height = get_sprite("floor").get_rect().height
+        min_y = RULES.pipe_margin
+        max_y = SCREEN_HEIGHT - sprite_floor_height - RULES.pipe_margin
+
+        # 전역 random 대신 게임마다 seed 가 정해진 rng 를 써서 같은 게임을 다시 만들 수 있게 한다
+        self.rect.midleft = (SCREEN_WIDTH, self.rng.uniform(min_y, max_y))
+        self.body.x, self.body.y = self.rect.topleft
+        self.passed = False
+
+    def update(self, dt):
+        self.body.step(steps(dt))
+        self.body.sync(self.rect)
+
+        if self.rect.right <= 0:
+            if self.pool is not None:
+                self.pool.release(self)
+            else:
+                self.kill()
+
+    def gap_top(self):
+        # 위/아래 파이프 사이 구멍의 위쪽 끝 (flappy.sim.SimPipe 와 같은 값)
+        return self.body.y + (self.rect.height - self.gap) / 2
+
+    def gap_bottom(self):
+        return self.gap_top() + self.gap
+
+
+class Message(Sprite):
+    # 화면 가운데에 띄우는 안내 이미지 (시작 안내, 게임 오버)
+    # 한 번만 만들어두고 상태가 바뀔 때 그룹에 넣었다 뺐다 한다.
+
+    def __init__(self, image, *groups, center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)):
+        self._layer = Layer.UI
+        self.image = image
+        self.rect = self.image.get_rect(center=center)
+        super().__init__(*groups)
+
+
+class Score(Sprite):
+    # 숫자 이미지(assets/sprites/0.png ~ 9.png)로 점수를 표시한다
+    #
+    # value 가 바뀔 때만 이미지를 다시 만들고, 만든 이미지는 점수별로 최근 cache_size 개를 보관한다 (LRU).
+    # 그래서 매 프레임 글자를 렌더링하거나 숫자를 하나씩 blit 하지 않는다.
+    # align 은 position 을 어디에 맞출지: "left" (왼쪽 위), "center" (가운데 위), "right" (오른쪽 위)
+    ANCHORS = {"left": "topleft", "center": "midtop", "right": "topright"}
+
+    def __init__(self, *groups, position=(SCREEN_WIDTH // 2, 40), align="center", cache_size=32):
+        self._layer = Layer.UI
+        self.digits = [get_sprite(str(digit)) for digit in range(10)]
+        self.position = position
+        self.anchor = self.ANCHORS[align]
+        self.cache_size = cache_size
+
+        self._images: OrderedDict[int, pygame.Surface] = OrderedDict()
+        self._value = None
+        self.value = 0
+
+        super().__init__(*groups)
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        if value == self._value:
+            return
+        self._value = value
+        self.image = self._image(value)
+        # 자릿수가 바뀌어도 정렬 위치가 유지되도록 rect 를 다시 맞춘다
+        # (LayeredUpdates 가 이전 rect 와 새 rect 를 모두 다시 그릴 영역으로 돌려준다)
+        self.rect = self.image.get_rect(**{self.anchor: self.position})
+
+    def _image(self, value):
+        image = self._images.get(value)
+        if image is not None:
+            self._images.move_to_end(value)
+            return image
+
+        glyphs = [self.digits[int(digit)] for digit in str(value)]
+        width = sum(glyph.get_width() for glyph in glyphs)
+        height = max(glyph.get_height() for glyph in glyphs)
+        image = pygame.Surface((width, height), pygame.SRCALPHA)
+        x = 0
+        for glyph in glyphs:
+            image.blit(glyph, (x, 0))
+            x += glyph.get_width()
+        image = display_format(image)
+
+        self._images[value] = image
+        if len(self._images) > self.cache_size:
+            self._images.popitem(last=False)
+        return image
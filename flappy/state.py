@@ -0,0 +1,63 @@
+# 게임 진행 상태: 시작 화면 -> 게임 중 -> 게임 오버 -> (다시 시작) 시작 화면 -> ...
+#
+#   machine = StateMachine(GameState.TITLE)
+#   machine.on_enter(GameState.GAME_OVER, show_game_over)
+#   machine.change(GameState.PLAYING)
+#
+# 상태가 바뀔 때 한 번만 할 일(메시지 띄우기, 타이머 멈추기, 제자리 초기화)은 on_enter / on_exit 에 등록한다.
+# 매 프레임 GameOverMessage 를 새로 만드는 식으로 상태를 검사하면 그룹이 끝없이 커지기 때문이다.
+
+from enum import Enum, auto
+
+
+class GameState(Enum):
+    TITLE = auto()  # 시작 안내 화면. space 를 누르면 시작
+    PLAYING = auto()
+    GAME_OVER = auto()  # space / enter 를 누르면 시작 화면으로 (제자리 초기화)
+
+
+# 상태마다 바뀔 수 있는 다음 상태
+TRANSITIONS = {
+    GameState.TITLE: {GameState.PLAYING},
+    GameState.PLAYING: {GameState.GAME_OVER},
+    GameState.GAME_OVER: {GameState.TITLE},
+}
+
+
+class StateMachine:
+    def __init__(self, initial=GameState.TITLE, transitions=TRANSITIONS):
+        self.state = initial
+        self.transitions = transitions
+        self._enter = {state: [] for state in transitions}
+        self._exit = {state: [] for state in transitions}
+
+    def on_enter(self, state, callback):
+        self._enter[state].append(callback)
+
+    def on_exit(self, state, callback):
+        self._exit[state].append(callback)
+
+    def can_change(self, state):
+        return state in self.transitions[self.state]
+
+    def change(self, state):
+        if not self.can_change(state):
+            raise ValueError(f"{self.state.name} 에서 {state.name} 로 바꿀 수 없습니다")
+
+        for callback in self._exit[self.state]:
+            callback()
+        self.state = state
+        for callback in self._enter[state]:
+            callback()
+
+    def start(self):
+        # 처음 상태의 on_enter 를 실행한다 (콜백을 모두 등록한 뒤 한 번 호출)
+        for callback in self._enter[self.state]:
+            callback()
+
+    def __eq__(self, other):
+        if isinstance(other, GameState):
+            return self.state is other
+        return NotImplemented
+
+    __hash__ = None
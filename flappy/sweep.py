@@ -0,0 +1,151 @@
+# 게임 규칙 값(중력, 날갯짓 강도, 파이프 간격, 파이프 생성 간격)을 바꿔가며
+# 창 없이 게임을 많이 돌려보는 도구. CPU 코어를 모두 사용한다.
+#
+#   python -m flappy.sweep --gravity 0.3 0.4 0.5 --flap 5 6 7 --gap 90 100 --episodes 200 --output sweep_out
+#
+# 결과는 컬럼(열)마다 파일 하나씩 저장한다 (output/score.bin, output/frames.bin ...).
+# 작업이 끝나는 대로 파일 끝에 이어서 쓰므로 중간에 멈춰도 그때까지의 결과는 남는다.
+#
+#   results = load_results("sweep_out")   # {"score": np.ndarray, ...}
+
+import argparse
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+
+from flappy.batch import CEILING, FLOOR, PIPE
+from flappy.sim import DEFAULT_RULES, run_episode
+
+TIMEOUT = 4  # max_frames 까지 살아남음
+DEATH_CAUSE_CODES = {"pipe": PIPE, "ceiling": CEILING, "floor": FLOOR, None: TIMEOUT}
+
+COLUMNS = {
+    "combo": np.int32,
+    "episode": np.int32,
+    "seed": np.uint32,
+    "gravity": np.float64,
+    "flap_strength": np.float64,
+    "gap": np.float64,
+    "spawn_interval": np.int32,
+    "score": np.int32,
+    "frames": np.int32,
+    "death_cause": np.int8,
+}
+
+
+def episode_seed(base_seed, combo, episode):
+    # 어느 워커에서 몇 번째로 실행되든 같은 (combo, episode) 는 항상 같은 seed
+    sequence = np.random.SeedSequence(base_seed, spawn_key=(combo, episode))
+    return int(sequence.generate_state(1)[0])
+
+
+def run_chunk(task):
+    # 워커 프로세스에서 실행: 한 조합의 에피소드 여러 개를 돌려서 컬럼별 리스트로 돌려준다
+    combo, rules, episodes, base_seed, max_frames = task
+    rows = {name: [] for name in COLUMNS}
+    for episode in episodes:
+        seed = episode_seed(base_seed, combo, episode)
+        sim = run_episode(seed, rules, max_frames=max_frames)
+        rows["combo"].append(combo)
+        rows["episode"].append(episode)
+        rows["seed"].append(seed)
+        rows["gravity"].append(rules.gravity)
+        rows["flap_strength"].append(rules.flap_strength)
+        rows["gap"].append(rules.gap)
+        rows["spawn_interval"].append(rules.spawn_interval)
+        rows["score"].append(sim.score)
+        rows["frames"].append(sim.frame)
+        rows["death_cause"].append(DEATH_CAUSE_CODES[sim.death_cause])
+    return rows
+
+
+def make_tasks(grid, episodes, base_seed, max_frames, chunk_size):
+    for combo, values in enumerate(itertools.product(*grid.values())):
+        rules = replace(DEFAULT_RULES, **dict(zip(grid, values)))
+        for start in range(0, episodes, chunk_size):
+            chunk = range(start, min(start + chunk_size, episodes))
+            yield combo, rules, chunk, base_seed, max_frames
+
+
+def run_sweep(grid, output, episodes=100, seed=0, max_frames=10_000, workers=None, chunk_size=25):
+    output = Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+
+    schema = {
+        "columns": {name: np.dtype(dtype).str for name, dtype in COLUMNS.items()},
+        "death_causes": {str(code): cause or "timeout" for cause, code in DEATH_CAUSE_CODES.items()},
+        "grid": grid,
+        "episodes": episodes,
+        "seed": seed,
+        "max_frames": max_frames,
+    }
+    (output / "schema.json").write_text(json.dumps(schema, indent=2))
+
+    files = {name: open(output / f"{name}.bin", "wb") for name in COLUMNS}
+    tasks = make_tasks(grid, episodes, seed, max_frames, chunk_size)
+    total = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map 은 작업을 넣은 순서대로 결과를 돌려주므로 파일 내용도 항상 같은 순서가 된다
+            for rows in executor.map(run_chunk, tasks):
+                for name, dtype in COLUMNS.items():
+                    np.asarray(rows[name], dtype=dtype).tofile(files[name])
+                    files[name].flush()
+                total += len(rows["score"])
+    finally:
+        for file in files.values():
+            file.close()
+    return total
+
+
+def load_results(output):
+    output = Path(output)
+    schema = json.loads((output / "schema.json").read_text())
+    return {
+        name: np.fromfile(output / f"{name}.bin", dtype=np.dtype(dtype))
+        for name, dtype in schema["columns"].items()
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="게임 규칙 값을 바꿔가며 창 없이 게임을 돌립니다")
+    parser.add_argument("--gravity", type=float, nargs="+", default=[DEFAULT_RULES.gravity])
+    parser.add_argument("--flap", type=float, nargs="+", default=[DEFAULT_RULES.flap_strength])
+    parser.add_argument("--gap", type=float, nargs="+", default=[DEFAULT_RULES.gap])
+    parser.add_argument(
+        "--spawn-interval",
+        type=int,
+        nargs="+",
+        default=[DEFAULT_RULES.spawn_interval * 1000 // 60],
+        help="파이프 생성 간격 (밀리초, PIPE_SPAWN_INTERVAL)",
+    )
+    parser.add_argument("--episodes", type=int, default=100, help="조합마다 돌릴 게임 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-frames", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--output", default="sweep_out")
+    args = parser.parse_args()
+
+    grid = {
+        "gravity": args.gravity,
+        "flap_strength": args.flap,
+        "gap": args.gap,
+        # 밀리초 -> 60Hz 프레임
+        "spawn_interval": [round(ms * 60 / 1000) for ms in args.spawn_interval],
+    }
+
+    start = perf_counter()
+    total = run_sweep(
+        grid, args.output, args.episodes, args.seed, args.max_frames, args.workers
+    )
+    elapsed = perf_counter() - start
+
+    results = load_results(args.output)
+    print(f"{total} episodes in {elapsed:.2f}s ({total / elapsed:.0f} episodes/s, {args.workers} workers)")
+    print(f"mean score {results['score'].mean():.2f}, mean frames {results['frames'].mean():.0f}")
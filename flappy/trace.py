@@ -0,0 +1,154 @@
+# 게임 루프에서 일어난 일을 trace event JSON 파일로 저장하는 도구
+# chrome://tracing 이나 https://ui.perfetto.dev 에서 열면 프레임마다 무엇에 시간이 걸렸는지 볼 수 있다.
+#
+#   FLAPPY_TRACE=trace.json python main2-4-Pipe.py
+#
+#   tracer = tracer_from_env()
+#   with tracer.span("update"):          # 시간이 걸리는 구간 (span)
+#       sprites.update(dt)
+#   tracer.instant("score", {"value": 3})  # 한 순간에 일어난 일 (marker)
+#   tracer.close()
+#
+# 이벤트는 메모리에 모아두었다가 batch_size 개마다 백그라운드 스레드로 넘겨서 파일에 쓴다.
+# 그래서 게임 루프에서는 튜플 하나를 리스트에 넣는 비용만 든다.
+
+import json
+import os
+import queue
+import threading
+from time import perf_counter
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "args", "start")
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.complete(self.name, self.start, perf_counter(), self.cat, self.args)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Writer(threading.Thread):
+    # 받은 이벤트 묶음을 JSON 으로 바꿔서 파일 끝에 이어 쓴다. None 을 받으면 파일을 닫고 끝난다.
+
+    def __init__(self, path, pid, tid):
+        super().__init__(name="trace-writer", daemon=True)
+        self.path = path
+        self.pid = pid
+        self.tid = tid
+        self.batches = queue.Queue()
+
+    def run(self):
+        with open(self.path, "w") as file:
+            file.write('{"displayTimeUnit": "ms", "traceEvents": [\n')
+            file.write(json.dumps({
+                "name": "thread_name", "ph": "M", "pid": self.pid, "tid": self.tid,
+                "args": {"name": "game loop"},
+            }))
+            while True:
+                batch = self.batches.get()
+                if batch is None:
+                    break
+                file.write("".join(",\n" + json.dumps(self._event(*event)) for event in batch))
+            file.write("\n]}\n")
+
+    def _event(self, phase, name, cat, ts, dur, args):
+        event = {"name": name, "cat": cat, "ph": phase, "ts": ts, "pid": self.pid, "tid": self.tid}
+        if phase == "X":
+            event["dur"] = dur
+        elif phase == "i":
+            event["s"] = "g"  # 모든 트랙을 가로지르는 세로선으로 표시
+        if args:
+            event["args"] = args
+        return event
+
+
+class Tracer:
+    enabled = True
+
+    def __init__(self, path, batch_size=4096):
+        self.path = path
+        self.batch_size = batch_size
+        self._origin = perf_counter()
+        self._events = []
+
+        self._writer = _Writer(path, os.getpid(), threading.get_native_id())
+        self._writer.start()
+
+    def span(self, name, cat="game", args=None):
+        return _Span(self, name, cat, args)
+
+    def complete(self, name, start, end, cat="game", args=None):
+        # perf_counter 로 잰 시작/끝 시각으로 span 을 기록한다 (시각은 마이크로초 단위로 저장)
+        ts = (start - self._origin) * 1e6
+        self._append(("X", name, cat, ts, (end - start) * 1e6, args))
+
+    def instant(self, name, args=None, cat="event"):
+        self._append(("i", name, cat, (perf_counter() - self._origin) * 1e6, 0, args))
+
+    def flush(self):
+        if self._events:
+            self._writer.batches.put(self._events)
+            self._events = []
+
+    def close(self):
+        # 남은 이벤트를 모두 쓰고 파일을 닫을 때까지 기다린다
+        self.flush()
+        self._writer.batches.put(None)
+        self._writer.join()
+
+    def _append(self, event):
+        self._events.append(event)
+        if len(self._events) >= self.batch_size:
+            self.flush()
+
+
+class NullTracer:
+    # 추적을 끈 경우. 모든 호출이 아무 일도 하지 않는다.
+    enabled = False
+
+    def span(self, name, cat="game", args=None):
+        return _NULL_SPAN
+
+    def complete(self, name, start, end, cat="game", args=None):
+        pass
+
+    def instant(self, name, args=None, cat="event"):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+NULL_TRACER = NullTracer()
+
+
+def tracer_from_env(variable="FLAPPY_TRACE"):
+    # 환경 변수에 파일 경로가 있으면 그 파일로 기록하고, 없으면 아무것도 기록하지 않는다
+    path = os.environ.get(variable)
+    return Tracer(path) if path else NULL_TRACER
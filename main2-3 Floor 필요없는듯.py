@@ -1,17 +1,11 @@
 import pygame
-from pathlib import Path
 from pygame import Rect
 from pygame.sprite import Sprite, LayeredUpdates
-from pygame.surface import Surface
 from pygame.time import Clock
 from enum import IntEnum, auto
-TITLE = "Flappy Bird"
-SCREEN_WIDTH = 288
-SCREEN_HEIGHT = 512
 
-TOP_DIR = Path(__file__).parent
-PROJ_DIR = Path(__file__).parent
-SPRITES_DIR = PROJ_DIR / "assets" / "sprites"
+from flappy.settings import FPS, SCREEN_HEIGHT, SCREEN_WIDTH, TITLE
+from flappy.sprite_cache import get_sprite
 
 pygame.init()
 
@@ -26,7 +20,6 @@ sprites = LayeredUpdates()
 clock = Clock()
 
 
-
 class Layer(IntEnum):
     BACKGROUND = auto()
     OBSTACLE = auto()
@@ -35,16 +28,6 @@ class Layer(IntEnum):
     UI = auto()
 
 
-def load_sprites():
-    sprites = {}
-    for file in SPRITES_DIR.iterdir():
-        sprites[file.stem] = pygame.image.load(file)
-    return sprites
-
-
-def get_sprite(name) -> Surface:
-    return pygame.image.load(SPRITES_DIR / f"{name}.png")
-
 class Bird(Sprite):
     GRAVITY = 0.4  # 중력 (프레임마다 증가하는 떨어지는 속도)
     FLAP_STRENGTH = 6  # 날갯짓 강도
@@ -181,6 +164,6 @@ while running:
     sprites.update()
 
     pygame.display.flip()
-    clock.tick(60)  # 60 FPS
+    clock.tick(FPS)  # 60 FPS
 
 pygame.quit()
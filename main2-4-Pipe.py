@@ -1,254 +1,203 @@
+import os
 import random
-from enum import IntEnum, auto
-from pathlib import Path
 
 import pygame
-from pygame import Rect
-from pygame.sprite import LayeredUpdates, Sprite
-from pygame.surface import Surface
-from pygame.time import Clock
-
-TITLE = "Flappy Bird"
-SCREEN_WIDTH = 288
-SCREEN_HEIGHT = 512
-
-TOP_DIR = Path(__file__).parent
-PROJ_DIR = Path(__file__).parent
-SPRITES_DIR = PROJ_DIR / "assets" / "sprites"
-
-pygame.init()
-
-pygame.display.set_caption(TITLE)
-
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+from pygame.sprite import LayeredUpdates
+
+from flappy.assets import asset_manager
+from flappy.audio import pre_init
+from flappy.game import Game
+from flappy.headless import open_window
+from flappy.loop import GameLoop, Interpolation
+from flappy.profiler import FrameProfiler, ProfilerOverlay
+from flappy.render import Renderer
+from flappy.replay import SEED_RANGE
+from flappy.settings import FPS, SCREEN_HEIGHT, SCREEN_WIDTH, TICK_RATE, TITLE
+from flappy.sim import DEFAULT_RULES as RULES
+from flappy.sprites import Layer, Message, Score, ScrollLayer
+from flappy.state import GameState, StateMachine
+from flappy.trace import tracer_from_env
+
+# 스프라이트, 효과음, 아이콘은 모두 assets 에서 가져온다
+assets = asset_manager
+
+# 디스플레이가 없는 환경(CI 등)에서는 SDL dummy 드라이버로 창을 만든다
+pre_init()
+screen = open_window((SCREEN_WIDTH, SCREEN_HEIGHT), TITLE, icon=assets.icon())
+
+# 게임 시작 전에 스프라이트와 효과음을 한 번에 읽어서 준비해둔다 (화면 없이 실행하면 소리를 내지 않음)
+# (python -m flappy.atlas 로 만든 아틀라스가 있으면 PNG 대신 그 파일 하나만 읽는다)
+assets.warmup()
 
 
 # 스프라이트(Sprites) = 2D 그래픽 오브젝트
 sprites = LayeredUpdates()
-clock = Clock()
-
-
-
-class Layer(IntEnum):
-    BACKGROUND = auto()
-    OBSTACLE = auto()
-    FLOOR = auto()
-    PLAYER = auto()
-    UI = auto()
-
-
-def load_sprites():
-    sprites = {}
-    for file in SPRITES_DIR.iterdir():
-        sprites[file.stem] = pygame.image.load(file)
-    return sprites
-
-
-def get_sprite(name) -> Surface:
-    return pygame.image.load(SPRITES_DIR / f"{name}.png")
-
-class Bird(Sprite):
-    GRAVITY = 0.4  # 중력 (프레임마다 증가하는 떨어지는 속도)
-    FLAP_STRENGTH = 6  # 날갯짓 강도
-    ANIMATION_SPEED = 0.1  # 기본 애니메이션 속도
-    FLAP_ANIMATION_SPEED = 0.2  # 날갯짓 애니메이션 속도 (더 빠름)
-    FLAP_DURATION = 15  # space를 뗀 후 몇 프레임 동안 애니메이션이 계속될지 설정
 
-    def __init__(self, *groups):
-        self._layer = Layer.PLAYER  # 새는 위쪽 레이어에 그리기 위해 레이어를 1로 설정
+# 프레임 시간 측정. FLAPPY_PROFILE=1 이면 처음부터 화면에 표시 (F3 키로 켜고 끄기)
+# FLAPPY_PROFILE_OUT=파일경로(.csv/.json) 로 실행하면 종료할 때 기록을 저장한다
+# FLAPPY_TRACE=파일경로(.json) 로 실행하면 단계별 시간과 파이프 생성, 점수, 게임 오버를 trace 파일로 저장한다
+# (chrome://tracing 또는 https://ui.perfetto.dev 에서 열기)
+tracer = tracer_from_env()
+profiler = FrameProfiler(tracer=tracer)
+profiler_overlay = ProfilerOverlay(profiler, sprites, visible=os.environ.get("FLAPPY_PROFILE") == "1")
+PROFILE_PATH = os.environ.get("FLAPPY_PROFILE_OUT")
 
-        self.images = [
-            get_sprite("redbird-0"),  # 날개 접힌 상태
-            get_sprite("redbird-1"),  # 날개 중간 상태
-            get_sprite("redbird-2"),  # 날개 펴진 상태
-            get_sprite("redbird-1"),  # 날개 중간 상태
-        ]
+# 새, 파이프, 충돌, 점수 규칙은 Game 이 진행한다 (리플레이 재생도 같은 코드를 쓴다)
+game = Game(sprites, profiler=profiler, tracer=tracer, tick_rate=TICK_RATE)
 
-        # 기본 이미지는 첫번째 이미지로 설정
-        self.image = self.images[0]
+# 바뀐 부분만 화면에 내보내려면 True (느린 소프트웨어 화면에서 유리함)
+DIRTY_RENDERING = False
 
-        # 이미지의 위치는 (-50, 50)으로 설정
-        self.rect: Rect = self.image.get_rect(topleft=(-50, 50))
+# 하늘은 스프라이트 그룹 밖에서 화면 맨 뒤에 그리고 (Renderer 의 layers),
+# 바닥은 파이프를 가리도록 그룹 안에서 파이프 위 레이어에 그린다. 바닥은 파이프와 같은 속도로 움직인다.
+# 하늘은 화면 전체를 덮으므로 움직이면 매 프레임 전체를 다시 그려야 한다. 그래서 dirty 모드에서는 멈춰둔다.
+sky = ScrollLayer(assets.sprite("background"), 0 if DIRTY_RENDERING else RULES.background_speed)
+floor_image = assets.sprite("floor")
+floor = ScrollLayer(
+    floor_image, RULES.pipe_speed, SCREEN_HEIGHT - floor_image.get_height(), Layer.FLOOR, sprites
+)
+backgrounds = [sky]
 
-        self.mask = pygame.mask.from_surface(self.image)
+score = Score(sprites)
 
-        self.fall_speed = 0
+# 안내 메시지는 한 번만 만들어두고 상태가 바뀔 때 그룹에 넣었다 뺐다 한다
+title_message = Message(assets.sprite("message"))
+game_over_message = Message(assets.sprite("gameover"))
 
-        # 애니메이션 인덱스 및 속도 제어를 위한 변수
-        self.animation_index = 0
-        self.animation_timer = 0
+# 게임 seed (FLAPPY_SEED 로 지정 가능). 같은 seed 면 파이프가 같은 위치에 나온다
+# 다시 시작할 때마다 새 seed 를 쓴다. 리플레이 헤더에 저장할 수 있도록 0 ~ 2**64 - 1 로 맞춘다 (-1 도 가능)
+game_seed = int(os.environ.get("FLAPPY_SEED", random.randrange(2**32))) % SEED_RANGE
 
-        # space 키가 눌렸는지 여부
-        self.flapping = False
+renderer = Renderer(
+    screen, sprites, layers=backgrounds, overlays=[profiler_overlay], dirty=DIRTY_RENDERING
+)
 
-        # space를 뗀 후에도 몇 프레임 동안 펄럭이는 것을 유지하는 타이머
-        self.flap_timer = 0
 
-        super().__init__(*groups)
+# FLAPPY_REPLAY=파일경로 로 실행하면 게임이 끝날 때마다 그 게임의 리플레이를 저장한다
+# (python -m flappy.replay 로 재생)
+REPLAY_PATH = os.environ.get("FLAPPY_REPLAY")
 
-    def update(self):
-        # 날갯짓 상태에 따른 애니메이션 처리
-        if self.flapping or self.flap_timer > 0:
-            self.animation_timer += self.FLAP_ANIMATION_SPEED
-            if self.animation_timer >= 1:
-                self.animation_timer = 0
-                self.animation_index = (self.animation_index + 1) % len(self.images)
-                self.image = self.images[self.animation_index]
 
-            # 만약 space 키가 떼어진 상태라면 타이머를 줄임
-            if not self.flapping:
-                self.flap_timer -= 1
-        else:
-            # space 키가 눌리지 않았을 때는 0번째 이미지 (가만히 떨어지는 상태)
-            self.image = self.images[0]
+def save_replay():
+    if REPLAY_PATH:
+        game.replay.frame_count = game.frame
+        game.replay.save(REPLAY_PATH)
 
-        # 중력 및 위치 업데이트
-        self.fall_speed += self.GRAVITY
-        self.rect.y += self.fall_speed
 
-        # 새가 시작 위치로 이동하는 코드
-        if self.rect.x < 50:
-            self.rect.x += 3
+# 상태가 바뀔 때 한 번만 하는 일들
+# 다시 시작할 때는 스프라이트를 새로 만들지 않고 지금 있는 것들을 처음 상태로 되돌린다
+machine = StateMachine(GameState.TITLE)
 
-    def handle_event(self, event):
-        if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-            self.flapping = True
-            self.fall_speed = 0
-            self.fall_speed -= self.FLAP_STRENGTH
-
-        if event.type == pygame.KEYUP and event.key == pygame.K_SPACE:
-            self.flapping = False
-            self.flap_timer = self.FLAP_DURATION  # space 키를 뗀 후에도 애니메이션을 유지할 타이머 설정
-
-
-    def check_collision(self, sprites):
-        for sprite in sprites:
-            if ((type(sprite) is Pipe) and sprite.mask.overlap(self.mask, (
-                    self.rect.x - sprite.rect.x, self.rect.y - sprite.rect.y)) or
-                    self.rect.bottom < 0):
-                return True
-        return False
-
-
-
-class Background(Sprite):
-    def __init__(self, speed, *groups):
-        self._layer = Layer.BACKGROUND  # 배경은 아래쪽 레이어에 그리기 위해 레이어를 0으로 설정
-        super().__init__(*groups)
-        self.image = get_sprite("background")
-        self.speed = speed  # 배경의 스크롤 속도 설정
-        self.rect = self.image.get_rect(topleft=(0, 0))
-        self.rect2 = self.image.get_rect(topleft=(SCREEN_WIDTH, 0))  # 두 번째 배경 위치 설정
 
-    def update(self):
-        # 배경을 왼쪽으로 이동
-        self.rect.x -= self.speed
-        self.rect2.x -= self.speed
+def show_title():
+    sprites.add(title_message)
 
-        # 첫 번째 배경이 화면을 벗어나면 오른쪽 끝으로 이동
-        if self.rect.right <= 0:
-            self.rect.x = SCREEN_WIDTH
 
-        # 두 번째 배경이 화면을 벗어나면 오른쪽 끝으로 이동
-        if self.rect2.right <= 0:
-            self.rect2.x = SCREEN_WIDTH
+def start_game():
+    title_message.kill()
+    game.start(game_seed)
 
-    def draw(self, screen):
-        # 두 배경을 모두 그립니다
-        screen.blit(self.image, self.rect)
-        screen.blit(self.image, self.rect2)
 
+def game_over():
+    sprites.add(game_over_message)
+    tracer.instant("game over", {"frame": game.frame, "cause": game.death_cause})
+    assets.play_audio("hit")
+    save_replay()
 
 
-class Pipe(pygame.sprite.Sprite):
-    def __init__(self, *groups):
-        self._layer = Layer.OBSTACLE
-        self.gap = 100
+def restart():
+    global game_seed
+    game_over_message.kill()
+    game.reset()
+    score.value = 0
+    game_seed = random.randrange(2**32)
 
-        self.sprite = get_sprite("pipe-green")
-        self.sprite_rect = self.sprite.get_rect()
 
-        self.pipe_bottom = self.sprite
-        self.pipe_bottom_rect = self.pipe_bottom.get_rect(topleft=(0, self.sprite_rect.height + self.gap))
+machine.on_enter(GameState.TITLE, show_title)
+machine.on_enter(GameState.PLAYING, start_game)
+machine.on_enter(GameState.GAME_OVER, game_over)
+machine.on_exit(GameState.GAME_OVER, restart)
+machine.start()
 
-        self.pipe_top = pygame.transform.flip(self.sprite, False, True)
-        self.pipe_top_rect = self.pipe_top.get_rect(topleft=(0, 0))
 
-        self.image = pygame.surface.Surface((self.sprite_rect.width, self.sprite_rect.height * 2 + self.gap),
-                                            pygame.SRCALPHA)
-        self.image.blit(self.pipe_bottom, self.pipe_bottom_rect)
-        self.image.blit(self.pipe_top, self.pipe_top_rect)
-
-        sprite_floor_height = get_sprite("floor").get_rect().height
-        min_y = 100
-        max_y = SCREEN_HEIGHT - sprite_floor_height - 100
+def handle_events():
+    for event in pygame.event.get():
+        if event.type == pygame.QUIT:
+            game_loop.stop()
 
-        self.rect = self.image.get_rect(midleft=(SCREEN_WIDTH, random.uniform(min_y, max_y)))
-        self.mask = pygame.mask.from_surface(self.image)
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            profiler_overlay.toggle()
+            renderer.invalidate()
 
-        self.passed = False
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_SPACE, pygame.K_RETURN):
+            if machine == GameState.GAME_OVER:
+                # 다시 시작: 시작 화면으로 (이 키 입력은 새에게 전달하지 않음)
+                machine.change(GameState.TITLE)
+                continue
+            if machine == GameState.TITLE and event.key == pygame.K_SPACE:
+                machine.change(GameState.PLAYING)
 
-        super().__init__(*groups)
+        if machine != GameState.PLAYING:
+            continue
 
-    def update(self):
-        self.rect.x -= 2
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+            assets.play_audio("wing")
 
-        if self.rect.right <= 0:
-            self.kill()
+        # space 키는 리플레이에 기록하고 새에게 전달한다
+        game.handle_event(event)
 
-    def is_passed(self):
-        if self.rect.x < 50 and not self.passed:
-            self.passed = True
-            return True
-        return False
 
-bird = Bird(sprites)
-background = Background(2, sprites)
-# Pipe(sprites)
+def simulate(dt):
+    interpolation.snapshot()
 
+    with profiler.section("update"):
+        for layer in backgrounds:
+            layer.update(dt)
 
-PIPE_SPAWN_EVENT = pygame.USEREVENT + 1
-PIPE_SPAWN_INTERVAL = 1500  # 파이프 생성 간격 (밀리초, 2초마다)
-pygame.time.set_timer(PIPE_SPAWN_EVENT, PIPE_SPAWN_INTERVAL)
+        # 시작 화면에서는 배경과 바닥만 움직인다
+        if machine == GameState.TITLE:
+            floor.update(dt)
+            return
 
-running = True
-gameover = False
-gamestarted = False
+    # 모든 스프라이트 update, 충돌, 점수 (게임 오버 후에는 새가 떨어지는 것만 보여준다)
+    passed = game.step(dt)
 
-while running:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
+    if game.game_over:
+        if machine == GameState.PLAYING:
+            machine.change(GameState.GAME_OVER)
+        return
 
-        if event.type == PIPE_SPAWN_EVENT:
-            Pipe(sprites)
+    for _ in range(passed):
+        score.value += 1
+        tracer.instant("score", {"value": score.value})
+        assets.play_audio("point")
 
-        # if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-            # pygame.time.set_timer(PIPE_SPAWN_EVENT, 1000)
 
-        bird.handle_event(event)
+def render(alpha):
+    # 직전 상태와 현재 상태 사이(alpha)의 위치에 그린다
+    with interpolation.apply(alpha):
+        with profiler.section("draw"):
+            rects = renderer.draw()
+    with profiler.section("flip"):
+        renderer.present(rects)
 
-    screen.fill(0)
-    background.draw(screen)
-    sprites.draw(screen)
-    sprites.update()
 
+# 시뮬레이션은 TICK_RATE 로 일정하게, 그리기는 화면이 허용하는 만큼 (FPS 로 제한)
+interpolation = Interpolation(sprites, backgrounds)
+game_loop = GameLoop(tick_rate=TICK_RATE, max_fps=FPS, profiler=profiler)
+game_loop.run(handle_events, simulate, render)
 
-    if bird.check_collision(sprites) and not gameover:
-        gameover = True
-        gamestarted = False
-        GameOverMessage(sprites)
-        pygame.time.set_timer(column_create_event, 0)
-        assets.play_audio("hit")
+if DIRTY_RENDERING:
+    print(renderer.stats())
 
-    for sprite in sprites:
-        if type(sprite) is Column and sprite.is_passed():
-            score.value += 1
-            assets.play_audio("point")
+if PROFILE_PATH:
+    profiler.export(PROFILE_PATH)
 
-    # pygame.time.set_timer(PIPE_SPAWN_EVENT, 0)
+tracer.close()
 
-    pygame.display.flip()
-    clock.tick(60)  # 60 FPS
+if REPLAY_PATH and machine == GameState.PLAYING:
+    save_replay()
+if REPLAY_PATH:
+    print(f"seed {game.replay.seed}, replay saved to {REPLAY_PATH}")
 
 pygame.quit()